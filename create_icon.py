@@ -8,10 +8,10 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Import the icon creation module
-from slot_analyzer.ui.assets.create_icon import create_icon
-
 if __name__ == "__main__":
+    # Import here so Pillow is only loaded when the script actually runs
+    from slot_analyzer.ui.assets.create_icon import create_icon
+
     print("Creating application icon...")
     create_icon()
     print("Done!")
@@ -4,7 +4,13 @@ This script creates a minimal environment to launch the UI without
 requiring all the backend services to be available.
 """
 
+import importlib.abc
+import importlib.util
+import itertools
+import random
 import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
 import sys
 import os
 from pathlib import Path
@@ -32,30 +38,56 @@ class MockService:
     def close(self):
         pass
 
-# Create mock modules
-import sys
-from types import ModuleType
+def _mock_attribute(name):
+    """Resolve any public attribute of a mocked module to MockService."""
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return MockService
 
-# Create mock modules to avoid import errors
-mock_modules = [
-    'slot_analyzer.services.capture',
-    'slot_analyzer.services.symbol',
-    'slot_analyzer.services.pattern',
-    'slot_analyzer.queue'
-]
+class _MockServiceFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve stub modules for the backend services on first import."""
+    
+    MOCKED_MODULES = frozenset({
+        'slot_analyzer.services.capture',
+        'slot_analyzer.services.symbol',
+        'slot_analyzer.services.pattern',
+        'slot_analyzer.queue'
+    })
+    
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self.MOCKED_MODULES:
+            return importlib.util.spec_from_loader(fullname, self)
+        return None
+    
+    def create_module(self, spec):
+        return None  # Use the default module creation
+    
+    def exec_module(self, module):
+        module.__getattr__ = _mock_attribute
 
-for module_name in mock_modules:
-    if module_name not in sys.modules:
-        module = ModuleType(module_name)
-        module.CaptureService = MockService
-        module.SymbolRecognizer = MockService
-        module.PatternAnalyzer = MockService
-        module.MessageQueue = MockService
-        sys.modules[module_name] = module
+# Mock backend services to avoid import errors
+sys.meta_path.insert(0, _MockServiceFinder())
 
 # Now we can import our UI modules
+from slot_analyzer.log_utils import configure_logging
 from slot_analyzer.ui.theme import apply_theme
 
+# Simulated activity messages, shuffled once at import
+_STATUS_MESSAGES = tuple(random.sample([
+    "System ready. Awaiting command...",
+    "Scanning network for slot patterns...",
+    "Analyzing symbol distribution...",
+    "Pattern recognition active...",
+    "Monitoring data stream...",
+    "Secure connection established...",
+    "Processing capture data...",
+    "Symbol recognition initialized..."
+], k=8))
+
+# Symbol grid cell size in pixels
+CELL_WIDTH = 60
+CELL_HEIGHT = 48
+
 class SimpleHackerUI:
     """A simplified version of the slot analyzer UI with hacker styling."""
     
@@ -71,6 +103,20 @@ class SimpleHackerUI:
         # Apply hacker theme
         self.theme = apply_theme(self.root)
         
+        # Resolve each Consolas variant once; styles and canvas items share
+        # these handles instead of passing font tuples for Tk to re-parse
+        self.F_TITLE = tkfont.Font(root=self.root, family="Consolas", size=14, weight="bold")
+        self.F_HEAD = tkfont.Font(root=self.root, family="Consolas", size=10, weight="bold")
+        self.F_CELL = tkfont.Font(root=self.root, family="Consolas", size=12)
+        self.F_BODY = tkfont.Font(root=self.root, family="Consolas", size=9)
+        self.F_BOLD = tkfont.Font(root=self.root, family="Consolas", size=9, weight="bold")
+        self.F_TINY = tkfont.Font(root=self.root, family="Consolas", size=8)
+        
+        # Register the launcher styles once so every widget resolves them
+        # from the shared ttk style database
+        self.style = ttk.Style(self.root)
+        self._configure_styles()
+        
         # Set up the window
         self.root.geometry("1200x800")
         self.root.minsize(800, 600)
@@ -80,37 +126,103 @@ class SimpleHackerUI:
         self.root.grid_columnconfigure(0, weight=1)
         
         # Create main container
-        self.main_frame = tk.Frame(self.root, bg="#121212", bd=1, relief="solid")
+        self.main_frame = ttk.Frame(self.root, style="Panel.Hacker.TFrame")
         self.main_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
         # Add status bar
-        self.status_bar = tk.Frame(self.root, bg="#121212")
+        self.status_bar = ttk.Frame(self.root, style="Hacker.TFrame")
         self.status_bar.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
         
         # Status message
         self.status_message = tk.StringVar(value="System ready. Awaiting command...")
-        status_label = tk.Label(
+        self._status_iter = itertools.cycle(_STATUS_MESSAGES)
+        self._last_status = self.status_message.get()
+        status_label = ttk.Label(
             self.status_bar,
             textvariable=self.status_message,
-            bg="#121212",
-            fg="#a0a0a0",
-            font=("Consolas", 8)
+            style="Hacker.TLabel"
         )
         status_label.pack(side="left")
         
         # Version info
-        version_label = tk.Label(
+        version_label = ttk.Label(
             self.status_bar,
             text="v0.1.0 | SECURE CONNECTION",
-            bg="#121212",
-            fg="#a0a0a0",
-            font=("Consolas", 8)
+            style="Hacker.TLabel"
         )
         version_label.pack(side="right")
         
         # Set up the main content
         self._setup_content()
     
+    def _configure_styles(self):
+        """Register the ttk styles used by the launcher widgets."""
+        style = self.style
+        
+        # Frames
+        style.configure("Hacker.TFrame", background="#121212")
+        style.configure(
+            "Panel.Hacker.TFrame",
+            background="#121212",
+            borderwidth=1,
+            relief="solid"
+        )
+        
+        # Labels
+        style.configure(
+            "Hacker.TLabel",
+            background="#121212",
+            foreground="#a0a0a0",
+            font=self.F_TINY
+        )
+        style.configure(
+            "Title.Hacker.TLabel",
+            foreground="#00ff41",
+            font=self.F_TITLE
+        )
+        style.configure(
+            "Heading.Hacker.TLabel",
+            foreground="#00ff41",
+            font=self.F_HEAD
+        )
+        style.configure(
+            "Display.Hacker.TLabel",
+            background="#1a1a1a",
+            font=self.F_BODY,
+            borderwidth=1,
+            relief="solid"
+        )
+        
+        # Label frames
+        style.configure("Hacker.TLabelframe", background="#121212", borderwidth=1)
+        style.configure(
+            "Hacker.TLabelframe.Label",
+            background="#121212",
+            foreground="#00ff41",
+            font=self.F_BODY
+        )
+        
+        # Buttons
+        style.configure(
+            "Hacker.TButton",
+            background="#1a1a1a",
+            foreground="#00ff41",
+            font=self.F_BOLD,
+            borderwidth=1,
+            relief="flat",
+            padding=(10, 5)
+        )
+        style.map(
+            "Hacker.TButton",
+            background=[("active", "#1a1a1a")],
+            foreground=[("active", "#00ff41"), ("disabled", "#a0a0a0")]
+        )
+        style.configure(
+            "Muted.Hacker.TButton",
+            foreground="#a0a0a0",
+            font=self.F_BODY
+        )
+    
     def _setup_content(self):
         """Set up the main content area."""
         # Configure main frame grid
@@ -118,178 +230,182 @@ class SimpleHackerUI:
         self.main_frame.grid_columnconfigure(1, weight=1)
         
         # Header
-        header = tk.Frame(self.main_frame, bg="#121212", height=50)
+        header = ttk.Frame(self.main_frame, style="Hacker.TFrame", height=50)
         header.grid(row=0, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
         
         # Title
-        title = tk.Label(
+        title = ttk.Label(
             header,
             text="SLOT ANALYZER CONTROL PANEL",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 14, "bold")
+            style="Title.Hacker.TLabel"
         )
         title.pack(side="left", padx=10)
         
         # Control buttons
-        btn_frame = tk.Frame(header, bg="#121212")
+        btn_frame = ttk.Frame(header, style="Hacker.TFrame")
         btn_frame.pack(side="right", padx=10)
         
-        start_btn = tk.Button(
+        start_btn = ttk.Button(
             btn_frame,
             text="START SESSION",
-            bg="#1a1a1a",
-            fg="#00ff41",
-            font=("Consolas", 9, "bold"),
-            bd=1,
-            relief="flat",
-            padx=10,
-            pady=5,
-            activebackground="#1a1a1a",
-            activeforeground="#00ff41"
+            style="Hacker.TButton"
         )
         start_btn.pack(side="left", padx=5)
         
-        reset_btn = tk.Button(
+        reset_btn = ttk.Button(
             btn_frame,
             text="RESET",
-            bg="#1a1a1a",
-            fg="#a0a0a0",
-            font=("Consolas", 9),
-            bd=1,
-            relief="flat",
-            padx=10,
-            pady=5,
+            style="Muted.Hacker.TButton",
             state="disabled"
         )
         reset_btn.pack(side="left", padx=5)
         
         # Left panel
-        left_panel = tk.Frame(self.main_frame, bg="#121212", width=250)
+        left_panel = ttk.Frame(self.main_frame, style="Hacker.TFrame", width=250)
         left_panel.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
         left_panel.grid_propagate(False)
         
         # Left panel title
-        left_title = tk.Label(
+        left_title = ttk.Label(
             left_panel,
             text="SESSION CONTROL",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 10, "bold")
+            style="Heading.Hacker.TLabel"
         )
         left_title.pack(anchor="w", padx=10, pady=5)
         
         # Session list
-        session_frame = tk.LabelFrame(
+        session_frame = ttk.LabelFrame(
             left_panel,
             text="ACTIVE SESSIONS",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 9),
-            bd=1
+            style="Hacker.TLabelframe"
         )
         session_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Center panel
-        center_panel = tk.Frame(self.main_frame, bg="#121212")
+        center_panel = ttk.Frame(self.main_frame, style="Hacker.TFrame")
         center_panel.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
         
         # Center panel title
-        center_title = tk.Label(
+        center_title = ttk.Label(
             center_panel,
             text="SYMBOL GRID",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 10, "bold")
+            style="Heading.Hacker.TLabel"
         )
         center_title.pack(anchor="w", padx=10, pady=5)
         
         # Symbol grid
-        grid_frame = tk.LabelFrame(
+        grid_frame = ttk.LabelFrame(
             center_panel,
             text="CURRENT SYMBOLS",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 9),
-            bd=1
+            style="Hacker.TLabelframe"
         )
         grid_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
-        # Create grid cells
+        # Draw the grid on a single canvas; each cell is a rectangle and a
+        # text item, and updates reconfigure the text item in place
+        self.canvas = tk.Canvas(
+            grid_frame,
+            width=5 * CELL_WIDTH,
+            height=3 * CELL_HEIGHT,
+            bg="#121212",
+            highlightthickness=0
+        )
+        self.canvas.pack(padx=5, pady=5)
+        self.cell_ids = [[0] * 5 for _ in range(3)]
+        self._cell_text = [["?"] * 5 for _ in range(3)]
         for row in range(3):
             for col in range(5):
-                cell = tk.Label(
-                    grid_frame,
+                x0 = col * CELL_WIDTH
+                y0 = row * CELL_HEIGHT
+                self.canvas.create_rectangle(
+                    x0 + 2, y0 + 2,
+                    x0 + CELL_WIDTH - 2, y0 + CELL_HEIGHT - 2,
+                    fill="#1a1a1a",
+                    outline="#a0a0a0"
+                )
+                self.cell_ids[row][col] = self.canvas.create_text(
+                    x0 + CELL_WIDTH // 2,
+                    y0 + CELL_HEIGHT // 2,
                     text="?",
-                    width=4,
-                    height=2,
-                    bg="#1a1a1a",
-                    fg="#e0e0e0",
-                    font=("Consolas", 12),
-                    bd=1,
-                    relief="solid"
+                    fill="#e0e0e0",
+                    font=self.F_CELL,
+                    tags=("cell",)
                 )
-                cell.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
         
         # Right panel
-        right_panel = tk.Frame(self.main_frame, bg="#121212", width=300)
+        right_panel = ttk.Frame(self.main_frame, style="Hacker.TFrame", width=300)
         right_panel.grid(row=1, column=2, sticky="nsew", padx=5, pady=5)
         right_panel.grid_propagate(False)
         
         # Right panel title
-        right_title = tk.Label(
+        right_title = ttk.Label(
             right_panel,
             text="DATA MONITOR",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 10, "bold")
+            style="Heading.Hacker.TLabel"
         )
         right_title.pack(anchor="w", padx=10, pady=5)
         
         # Capture monitor
-        monitor_frame = tk.LabelFrame(
+        monitor_frame = ttk.LabelFrame(
             right_panel,
             text="CAPTURE FEED",
-            bg="#121212",
-            fg="#00ff41",
-            font=("Consolas", 9),
-            bd=1
+            style="Hacker.TLabelframe"
         )
         monitor_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Status display
-        status_display = tk.Label(
+        status_display = ttk.Label(
             monitor_frame,
             text="Waiting for capture...",
-            bg="#1a1a1a",
-            fg="#a0a0a0",
-            font=("Consolas", 9),
-            bd=1,
-            relief="solid",
+            style="Display.Hacker.TLabel",
             width=30,
-            height=10
+            anchor="nw",
+            padding=5
         )
         status_display.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Update status periodically to simulate activity
         self._update_status()
     
+    def update_cell(self, row, col, text):
+        """Update a single symbol grid cell.
+        
+        The cell is only reconfigured when its text actually changes.
+        
+        Args:
+            row: Grid row index
+            col: Grid column index
+            text: Symbol text to display
+        """
+        if self._cell_text[row][col] == text:
+            return
+        self._cell_text[row][col] = text
+        self.canvas.itemconfigure(self.cell_ids[row][col], text=text)
+    
+    def update_cells(self, symbols):
+        """Update the symbol grid from a 2D list of symbols.
+        
+        Args:
+            symbols: Rows of symbol strings; empty values are shown as "?"
+        """
+        for row, row_symbols in enumerate(symbols[:len(self.cell_ids)]):
+            for col, symbol in enumerate(row_symbols[:len(self.cell_ids[row])]):
+                self.update_cell(row, col, symbol or "?")
+        
+        # Flush pending redraws once for the whole batch
+        self.root.update_idletasks()
+    
+    def reset_cells(self):
+        """Reset every symbol grid cell to "?" with a single canvas call."""
+        self._cell_text = [["?"] * 5 for _ in range(3)]
+        self.canvas.itemconfigure("cell", text="?")
+    
     def _update_status(self):
         """Update status messages to simulate activity."""
-        import random
-        
-        messages = [
-            "System ready. Awaiting command...",
-            "Scanning network for slot patterns...",
-            "Analyzing symbol distribution...",
-            "Pattern recognition active...",
-            "Monitoring data stream...",
-            "Secure connection established...",
-            "Processing capture data...",
-            "Symbol recognition initialized..."
-        ]
-        
-        self.status_message.set(random.choice(messages))
+        message = next(self._status_iter)
+        if message != self._last_status:
+            self._last_status = message
+            self.status_message.set(message)
         self.root.after(3000, self._update_status)
     
     def run(self):
@@ -298,6 +414,7 @@ class SimpleHackerUI:
 
 def main():
     """Main entry point."""
+    configure_logging()
     try:
         # Create the root window
         root = tk.Tk()
@@ -12,10 +12,12 @@ setup(
         "python-dotenv>=1.0.0",
         "pyyaml>=6.0.1",
         "structlog>=23.1.0",
+        "orjson>=3.9",
         "loguru>=0.7.0",
         "pydantic>=2.4.2",
         "kombu>=5.3.1",
-        "redis>=5.0.0",
+        "redis>=5.0.1",
+        "zstandard>=0.22.0",
         "aioredis>=2.0.1",
         "click>=8.1.3",
         "pillow>=10.0.0",  # For image handling
@@ -26,13 +28,12 @@ setup(
             "slot-analyzer-ui=slot_analyzer.ui_launcher:main",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
     ],
 )
\ No newline at end of file
@@ -1,28 +1,61 @@
 """Command-line interface for the Slot Game Analyzer."""
 
+import asyncio
+import os
 import sys
 import signal
-import time
+import threading
 import click
 from typing import Optional
 
-from slot_analyzer.config import settings
-from slot_analyzer.log_utils import get_logger
-from slot_analyzer.services import ServiceRegistry, health_service
-from slot_analyzer.message_broker import message_queue
+from slot_analyzer import __version__
+from slot_analyzer.log_utils import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
+# Set by the signal handlers to release the main thread from start()
+_shutdown = threading.Event()
+
+# A bare wait() cannot be interrupted by Ctrl+C on Windows, so wake up
+# periodically there; POSIX delivers signals into the wait directly
+_WAIT_TIMEOUT = 1.0 if sys.platform == "win32" else None
+
 def handle_shutdown(signal_num: int, frame: Optional[object]) -> None:
-    """Handle application shutdown gracefully."""
+    """Handle application shutdown gracefully.
+
+    Only signal-safe work happens here; logging and cleanup run in
+    _shutdown_services once start() is released from its wait.
+    """
+    os.write(2, b"Shutting down...\n")
+    _shutdown.set()
+
+def _install_uvloop() -> None:
+    """Run the event loops this process creates on uvloop when installed.
+
+    uvloop's libuv-based loop dispatches the proxy's socket callbacks faster
+    than the default selector loop; it is optional and unavailable on
+    Windows. Set here, by the process entry point, rather than at import so
+    importing the proxy as a library leaves the host's loop policy alone.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+def _shutdown_services() -> None:
+    """Release services and exit once a shutdown has been requested."""
     logger.info("Shutting down application...")
-    
     try:
+        from slot_analyzer.message_broker import get_message_queue
+        from slot_analyzer.services import registry
+
         # Cleanup services
-        ServiceRegistry.cleanup()
+        registry.cleanup()
         
-        # Close message queue connection
-        message_queue.close()
+        # Close the message queue connection if one was ever created
+        if get_message_queue.cache_info().currsize:
+            get_message_queue().close()
         
         logger.info("Shutdown complete")
         sys.exit(0)
@@ -30,34 +63,18 @@ def handle_shutdown(signal_num: int, frame: Optional[object]) -> None:
         logger.error("Error during shutdown", error=str(e))
         sys.exit(1)
 
-    while True:
-        time.sleep(1)
-
-    while True:
-        time.sleep(1)
-
-    while True:
-        time.sleep(1)
-
-    while True:
-        time.sleep(1)
-
-    while True:
-        time.sleep(1)
-
-# Register shutdown handlers
-signal.signal(signal.SIGINT, handle_shutdown)
-signal.signal(signal.SIGTERM, handle_shutdown)
-
 @click.group()
-@click.version_option(version=settings.APP_VERSION)
+@click.version_option(version=__version__)
 def cli() -> None:
     """Slot Game Analyzer CLI."""
-    pass
+    # Runs only when a subcommand is invoked, so --help/--version skip it
+    configure_logging()
 
 @cli.command()
 def health() -> None:
     """Check system health."""
+    from slot_analyzer.services import health_service
+
     try:
         result = health_service.check_health()
         if result["status"] == "healthy":
@@ -80,27 +97,41 @@ def health() -> None:
 )
 def start(debug: bool) -> None:
     """Start the Slot Game Analyzer."""
+    from slot_analyzer.config import RUNTIME, get_fast_settings
+    from slot_analyzer.services import health_service
+
+    settings = get_fast_settings()
+
     try:
         if debug:
-            settings.DEBUG = True
+            RUNTIME["debug"] = True
             click.echo("Debug mode enabled")
         
         click.echo(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
         click.echo("Press Ctrl+C to stop")
         
+        _install_uvloop()
+        
+        # Register shutdown handlers here rather than at import so importing
+        # the CLI as a library leaves the host's handlers untouched
+        signal.signal(signal.SIGINT, handle_shutdown)
+        signal.signal(signal.SIGTERM, handle_shutdown)
+        
         # Verify system health before starting
         health_result = health_service.check_health()
         if health_result["status"] != "healthy":
             raise click.ClickException("System health check failed")
             
-        # Main application loop
-        while True:
-            time.sleep(1)
+        # Block until a shutdown signal arrives
+        while not _shutdown.wait(_WAIT_TIMEOUT):
+            pass
             
     except Exception as e:
         click.echo(click.style(f"Error: {str(e)}", fg="red"))
         sys.exit(1)
 
+    _shutdown_services()
+
 def main() -> None:
     """Main entry point for the CLI."""
     try:
@@ -0,0 +1,149 @@
+"""Pydantic settings model for the Slot Game Analyzer."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+__all__ = ['Settings', 'get_settings']
+
+@lru_cache(maxsize=1)
+def get_settings() -> "Settings":
+    """Get the application settings instance"""
+    settings = Settings()
+    settings.validate_paths()
+    return settings
+
+class Settings(BaseSettings):
+    """Base configuration settings."""
+    
+    # Application settings
+    APP_NAME: str = Field(
+        default="Slot Game Analyzer",
+        description="Application name"
+    )
+    APP_VERSION: str = Field(
+        default="0.1.0",
+        description="Application version"
+    )
+    ENV: str = Field(
+        default="development",
+        description="Runtime environment (development|production|staging)",
+        validation_alias="SLOT_ANALYZER_ENV"
+    )
+    DEBUG: bool = Field(
+        default=False,
+        description="Enable debug mode",
+        validation_alias="SLOT_ANALYZER_DEBUG"
+    )
+    
+    # Paths
+    BASE_DIR: Path = Field(
+        default=Path(__file__).resolve().parent.parent.parent,
+        description="Base directory for the application"
+    )
+    DATA_DIR: Path = Field(
+        default=Path("data"),
+        description="Directory for application data"
+    )
+    SCREENSHOT_DIR: Path = Field(
+        default=Path("screenshots"),
+        description="Directory to store captured screenshots",
+        validation_alias="SLOT_ANALYZER_CAPTURE_SCREENSHOT_DIR"
+    )
+    CACHE_DIR: Path = Field(
+        default=Path("cache"),
+        description="Directory for preprocessed data reused across restarts"
+    )
+    
+    # Redis settings
+    REDIS_HOST: str = Field(
+        default="localhost",
+        description="Redis server hostname"
+    )
+    REDIS_PORT: int = Field(
+        default=6379,
+        description="Redis server port"
+    )
+    REDIS_DB: int = Field(
+        default=0,
+        description="Redis database number"
+    )
+    MAX_PRODUCERS: int = Field(
+        default=10,
+        description="Maximum number of pooled message queue producers",
+        validation_alias="SLOT_ANALYZER_MAX_PRODUCERS"
+    )
+    
+    # Proxy settings
+    PROXY_HOST: str = Field(
+        default="127.0.0.1",
+        description="Proxy server hostname"
+    )
+    PROXY_PORT: int = Field(
+        default=8080,
+        description="Proxy server port",
+        validation_alias="SLOT_ANALYZER_CAPTURE_PROXY_PORT"
+    )
+    CERT_DIR: Path = Field(
+        default=Path("certificates"),
+        description="Directory for SSL certificates"
+    )
+    
+    # Capture settings
+    CAPTURE_THROTTLE_MS: int = Field(
+        default=500,
+        description="Minimum time between screenshots in milliseconds",
+        validation_alias="SLOT_ANALYZER_CAPTURE_SCREENSHOT_THROTTLE_MS"
+    )
+    MAX_CAPTURE_QUEUE: int = Field(
+        default=100,
+        description="Maximum number of captures to queue before dropping",
+        validation_alias="SLOT_ANALYZER_CAPTURE_MAX_CAPTURE_QUEUE"
+    )
+    
+    # Logging
+    LOG_LEVEL: str = Field(
+        default="INFO",
+        description="Logging level (DEBUG|INFO|WARNING|ERROR|CRITICAL)"
+    )
+    LOG_FORMAT: str = Field(
+        default="structured",
+        description="Log format (structured|plain)"
+    )
+    LOG_FILE: Optional[Path] = Field(
+        default=None,
+        description="Optional path to log file"
+    )
+
+    # Frozen: runtime toggles live in RUNTIME instead of on the settings
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",  # Ignore extra environment variables
+        frozen=True,
+        validate_assignment=False,
+        # Aliased fields can still be passed by field name
+        populate_by_name=True
+    )
+
+    def validate_paths(self) -> dict:
+        """
+        Validate that required directories exist or can be created.
+        Returns dictionary of full paths keyed by directory name.
+        """
+        required_dirs = {
+            "DATA_DIR": self.DATA_DIR,
+            "SCREENSHOT_DIR": self.SCREENSHOT_DIR,
+            "CACHE_DIR": self.CACHE_DIR,
+            "CERT_DIR": self.CERT_DIR
+        }
+        path_dict = {
+            name: self.BASE_DIR / path for name, path in required_dirs.items()
+        }
+        for full_path in path_dict.values():
+            full_path.mkdir(parents=True, exist_ok=True)
+            
+        return path_dict
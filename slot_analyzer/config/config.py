@@ -1,5 +1,6 @@
 """Configuration management system for slot analyzer application."""
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from configparser import ConfigParser
@@ -24,6 +25,14 @@ class CaptureSettings(BaseSettings):
         100,
         description="Maximum number of captures to queue before dropping"
     )
+    publish_batch_size: int = Field(
+        64,
+        description="Maximum number of captures published in one batch"
+    )
+    publish_batch_ms: int = Field(
+        50,
+        description="Time to let a partial batch fill before publishing in milliseconds"
+    )
 
     @validator('screenshot_throttle_ms')
     def validate_throttle(cls, v):
@@ -51,6 +60,17 @@ class AppSettings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
 
+@lru_cache(maxsize=8)
+def _parse_ini(path: str, mtime_ns: int) -> Dict[str, Dict[str, str]]:
+    """Parse an INI file into a dict of sections.
+
+    Keyed on the file's modification time so unchanged files are only
+    parsed once.
+    """
+    config = ConfigParser()
+    config.read(path)
+    return {section: dict(config[section]) for section in config.sections()}
+
 def load_config() -> AppSettings:
     """Load configuration with environment overrides."""
     # Load from .env file if present
@@ -60,24 +80,23 @@ def load_config() -> AppSettings:
         load_dotenv(env_file)
 
     # Load from config.ini if present
-    config = ConfigParser()
     config_file = Path("config.ini")
     if config_file.exists():
-        config.read(config_file)
+        ini = _parse_ini(str(config_file), config_file.stat().st_mtime_ns)
+    else:
+        ini = {}
 
     # Create settings with environment overrides
     settings = AppSettings()
 
     # Apply INI file overrides if present
-    if config.has_section("slot_analyzer"):
-        for key, value in config["slot_analyzer"].items():
-            if hasattr(settings, key):
-                setattr(settings, key, value)
+    for key, value in ini.get("slot_analyzer", {}).items():
+        if hasattr(settings, key):
+            setattr(settings, key, value)
 
     return settings
 
+@lru_cache(maxsize=1)
 def get_config() -> AppSettings:
     """Get the application configuration (singleton pattern)."""
-    if not hasattr(get_config, "_instance"):
-        get_config._instance = load_config()
-    return get_config._instance
\ No newline at end of file
+    return load_config()
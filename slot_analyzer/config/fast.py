@@ -0,0 +1,73 @@
+"""Lightweight settings for startup-critical code paths.
+
+Reads the same environment variables as ``Settings`` (its field names, or
+the ``validation_alias`` where one is set) without importing pydantic:
+from ``os.environ`` first, then from the ``.env`` file.
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+@lru_cache(maxsize=1)
+def _dotenv() -> Dict[str, str]:
+    """Values from the .env file, keyed by upper-cased name.
+    
+    ``Settings`` matches .env names case-insensitively, so they are
+    normalised to the upper-case names used here.
+    """
+    from dotenv import dotenv_values
+    
+    values = dotenv_values(".env", encoding="utf-8")
+    return {name.upper(): value for name, value in values.items() if value is not None}
+
+def _lookup(name: str, default: str) -> str:
+    """Read a setting from the environment, falling back to .env."""
+    value = os.environ.get(name)
+    if value is None:
+        value = _dotenv().get(name, default)
+    return value
+
+def _env(name: str, default: str, cast: Callable[[str], Any] = str) -> Any:
+    """Build a dataclass field populated from an environment variable."""
+    return field(default_factory=lambda: cast(_lookup(name, default)))
+
+def _as_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _as_optional_path(value: str) -> Optional[Path]:
+    return Path(value) if value else None
+
+@dataclass(slots=True, frozen=True)
+class FastSettings:
+    """Environment-backed subset of the application settings."""
+    
+    # Application settings
+    APP_NAME: str = "Slot Game Analyzer"
+    APP_VERSION: str = "0.1.0"
+    ENV: str = _env("SLOT_ANALYZER_ENV", "development")
+    DEBUG: bool = _env("SLOT_ANALYZER_DEBUG", "false", _as_bool)
+    
+    # Redis settings
+    REDIS_HOST: str = _env("REDIS_HOST", "localhost")
+    REDIS_PORT: int = _env("REDIS_PORT", "6379", int)
+    REDIS_DB: int = _env("REDIS_DB", "0", int)
+    
+    # Proxy settings
+    PROXY_HOST: str = _env("PROXY_HOST", "127.0.0.1")
+    PROXY_PORT: int = _env("SLOT_ANALYZER_CAPTURE_PROXY_PORT", "8080", int)
+    
+    # Capture settings
+    CAPTURE_THROTTLE_MS: int = _env("SLOT_ANALYZER_CAPTURE_SCREENSHOT_THROTTLE_MS", "500", int)
+    MAX_CAPTURE_QUEUE: int = _env("SLOT_ANALYZER_CAPTURE_MAX_CAPTURE_QUEUE", "100", int)
+    
+    # Logging
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
+    LOG_FILE: Optional[Path] = _env("LOG_FILE", "", _as_optional_path)
+
+@lru_cache(maxsize=1)
+def get_fast_settings() -> FastSettings:
+    """Get the lightweight settings instance"""
+    return FastSettings()
@@ -1,18 +1,21 @@
 """
 Game layout configuration for symbol recognition.
 """
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from typing import List, Tuple
 from pathlib import Path
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True, frozen=True)
 class SymbolTemplate:
     """Represents a symbol template for matching"""
     name: str
     template_path: Path
     confidence_threshold: float = 0.8
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridPosition:
     """Represents a position on the game grid"""
     row: int
@@ -22,7 +25,7 @@ class GridPosition:
     width: int
     height: int
 
-@dataclass
+@dataclass(slots=True)
 class GameLayout:
     """Game-specific layout configuration"""
     name: str
@@ -30,6 +33,18 @@ class GameLayout:
     positions: List[GridPosition]
     symbols: List[SymbolTemplate]
     template_dir: Path
+    # Positions packed as an (N, 6) int32 array of
+    # (row, col, x, y, width, height), built from ``positions``
+    positions_array: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.positions_array = np.array(
+            [
+                (pos.row, pos.col, pos.x, pos.y, pos.width, pos.height)
+                for pos in self.positions
+            ],
+            dtype=np.int32
+        ).reshape(-1, 6)
 
     @property
     def symbol_count(self) -> int:
@@ -46,17 +61,23 @@ class GameLayout:
         if not self.template_dir.exists():
             return False
             
-        # Check if all template files exist
+        # Check if all template files exist, listing the directory once
+        # instead of stat-ing every template path
+        with os.scandir(self.template_dir) as entries:
+            present = {entry.name for entry in entries}
         for symbol in self.symbols:
-            if not (self.template_dir / symbol.template_path).exists():
+            template_path = Path(symbol.template_path)
+            if template_path.parent == Path("."):
+                if template_path.name not in present:
+                    return False
+            elif not (self.template_dir / template_path).exists():
                 return False
                 
         # Validate grid positions
         rows, cols = self.grid_size
-        for pos in self.positions:
-            if pos.row >= rows or pos.col >= cols:
-                return False
-            if pos.width <= 0 or pos.height <= 0:
-                return False
-                
-        return True
\ No newline at end of file
+        positions = self.positions_array
+        return bool(
+            (positions[:, 0] < rows).all()
+            and (positions[:, 1] < cols).all()
+            and (positions[:, 4:6] > 0).all()
+        )
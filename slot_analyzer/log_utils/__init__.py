@@ -3,13 +3,24 @@
 import sys
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
-from loguru import logger
 
-from slot_analyzer.config import settings
+def _orjson_renderer(_logger: Any, _method_name: str, event_dict: Dict[str, Any]) -> str:
+    """Render the event dict as JSON using orjson."""
+    return orjson.dumps(
+        event_dict,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 def configure_logging() -> None:
     """Configure structured logging for the application."""
+    from loguru import logger
+
+    from slot_analyzer.config import get_fast_settings
+
+    settings = get_fast_settings()
     
     # Configure structlog
     structlog.configure(
@@ -21,7 +32,7 @@ def configure_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            _orjson_renderer
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -55,6 +66,3 @@ def configure_logging() -> None:
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
-
-# Configure logging on module import
-configure_logging()
\ No newline at end of file
@@ -1,13 +1,37 @@
 """Message queue infrastructure for the Slot Game Analyzer."""
 
-from typing import Any, Callable, Dict, Optional
+import asyncio
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Union
+import orjson
+import zstandard
 from kombu import Connection, Exchange, Queue, Producer, Consumer
-from slot_analyzer.config import settings
+from kombu.pools import producers, set_limit
+from redis.asyncio import Redis
+from kombu.serialization import register
+from slot_analyzer.config import get_settings
 from slot_analyzer.log_utils import get_logger
 from slot_analyzer.errors import MessageQueueError
 
 logger = get_logger(__name__)
 
+def _orjson_dumps(obj: Any) -> bytes:
+    """Encode a message body with orjson, stringifying unknown types."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+# Bodies are still JSON on the wire, but under their own content type so
+# kombu's 'json' codec is left in place for every other user of it
+ORJSON_CONTENT_TYPE = 'application/x-orjson'
+
+register(
+    'orjson',
+    _orjson_dumps,
+    orjson.loads,
+    content_type=ORJSON_CONTENT_TYPE,
+    content_encoding='utf-8'
+)
+
 # Define default exchanges
 default_exchange = Exchange('slot_analyzer', type='direct')
 event_exchange = Exchange('slot_analyzer.events', type='topic')
@@ -16,55 +40,180 @@ event_exchange = Exchange('slot_analyzer.events', type='topic')
 analysis_queue = Queue('analysis', exchange=default_exchange, routing_key='analysis')
 event_queue = Queue('events', exchange=event_exchange, routing_key='events.#')
 
+# Approximate length cap for Redis streams written by stream_batch
+STREAM_MAXLEN = 100_000
+
+# Stream bodies at least this large are stored zstd-compressed under the
+# 'z' field instead of 'd'; smaller ones don't shrink enough to pay off
+STREAM_COMPRESS_MIN = 1024
+
+# A message body: a dict to serialize, or bytes already encoded as JSON
+Payload = Union[Dict[str, Any], bytes]
+
+# Retry policy shared by all publish paths
+_RETRY_POLICY = {
+    'interval_start': 0,
+    'interval_step': 2,
+    'interval_max': 30,
+    'max_retries': 3,
+}
+
 class MessageQueue:
     """Message queue manager for the application."""
     
     def __init__(self) -> None:
+        settings = get_settings()
         self.url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+        # Bound the producer pool so concurrent sessions each publish on
+        # their own channel without opening an unbounded number of them;
+        # read here rather than at import so importing stays settings-free
+        set_limit(settings.MAX_PRODUCERS)
         self._connection: Optional[Connection] = None
+        self._redis: Optional[Redis] = None
+        # Pending Redis closes, referenced so they are not garbage
+        # collected before they finish
+        self._close_tasks: Set[asyncio.Task] = set()
+        self._zstd_compressor = zstandard.ZstdCompressor(level=1)
+        self._zstd_decompressor = zstandard.ZstdDecompressor()
     
     @property
     def connection(self) -> Connection:
-        """Get or create a connection to the message queue."""
-        if self._connection is None or not self._connection.connected:
+        """Get the connection to the message queue, connecting on first use.
+        
+        Later drops are recovered by kombu's publish retry policy, so the
+        socket state is not probed on every access.
+        """
+        if self._connection is None:
+            connection = Connection(self.url)
             try:
-                self._connection = Connection(self.url)
-                self._connection.connect()
-                logger.info("Connected to message queue", url=self.url)
+                connection.ensure_connection(
+                    errback=self._on_connection_error,
+                    max_retries=_RETRY_POLICY['max_retries']
+                )
             except Exception as e:
                 raise MessageQueueError(f"Failed to connect to message queue: {str(e)}")
+            logger.info("Connected to message queue", url=self.url)
+            self._connection = connection
         return self._connection
 
+    @staticmethod
+    def _on_connection_error(exc: Exception, interval: float) -> None:
+        """Log a failed connection attempt before kombu retries it."""
+        logger.warning(
+            "Message queue connection failed, retrying",
+            error=str(exc),
+            retry_in=interval
+        )
+
+    @property
+    def redis(self) -> Redis:
+        """Get or create the asyncio Redis client used for streams."""
+        if self._redis is None:
+            self._redis = Redis.from_url(self.url, max_connections=16)
+        return self._redis
+
+    def _acquire_producer(self):
+        """Acquire a pooled producer for the current connection."""
+        return producers[self.connection].acquire(block=True, timeout=1)
+
+    @staticmethod
+    def _send(
+        producer: Producer,
+        payload: Payload,
+        routing_key: str,
+        exchange: Exchange
+    ) -> None:
+        """Publish one message, passing pre-encoded JSON bodies through."""
+        if isinstance(payload, bytes):
+            encoding = {'content_type': ORJSON_CONTENT_TYPE, 'content_encoding': 'utf-8'}
+        else:
+            encoding = {'serializer': 'orjson'}
+        producer.publish(
+            payload,
+            exchange=exchange,
+            routing_key=routing_key,
+            retry=True,
+            retry_policy=_RETRY_POLICY,
+            **encoding
+        )
+
     def publish(
         self,
-        payload: Dict[str, Any],
+        payload: Payload,
         routing_key: str,
         exchange: Exchange = default_exchange
     ) -> None:
         """Publish a message to the queue."""
         try:
-            with Producer(self.connection) as producer:
-                producer.publish(
-                    payload,
-                    exchange=exchange,
-                    routing_key=routing_key,
-                    serializer='json',
-                    retry=True,
-                    retry_policy={
-                        'interval_start': 0,
-                        'interval_step': 2,
-                        'interval_max': 30,
-                        'max_retries': 3,
-                    }
-                )
-                logger.debug(
-                    "Message published",
-                    routing_key=routing_key,
-                    exchange=exchange.name
-                )
+            with self._acquire_producer() as producer:
+                self._send(producer, payload, routing_key, exchange)
+            logger.debug(
+                "Message published",
+                routing_key=routing_key,
+                exchange=exchange.name
+            )
         except Exception as e:
             raise MessageQueueError(f"Failed to publish message: {str(e)}")
 
+    def publish_batch(
+        self,
+        payloads: Iterable[Payload],
+        routing_key: str,
+        exchange: Exchange = default_exchange
+    ) -> int:
+        """Publish several messages through one pooled producer.
+        
+        Returns:
+            int: Number of messages published
+        """
+        count = 0
+        try:
+            with self._acquire_producer() as producer:
+                for payload in payloads:
+                    self._send(producer, payload, routing_key, exchange)
+                    count += 1
+            logger.debug(
+                "Message batch published",
+                routing_key=routing_key,
+                exchange=exchange.name,
+                count=count
+            )
+        except Exception as e:
+            raise MessageQueueError(
+                f"Failed to publish message batch after {count} messages: {str(e)}"
+            )
+        return count
+
+    async def stream_batch(
+        self,
+        stream: str,
+        bodies: Iterable[bytes],
+        maxlen: int = STREAM_MAXLEN
+    ) -> int:
+        """Append pre-encoded JSON messages to a Redis stream.
+        
+        The whole batch goes out in one pipelined round trip, bypassing
+        kombu's exchange routing for high-volume topics. Large bodies are
+        compressed with zstd.
+        
+        Returns:
+            int: Number of messages appended
+        """
+        compress = self._zstd_compressor.compress
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for body in bodies:
+                    if len(body) >= STREAM_COMPRESS_MIN:
+                        fields = {b'z': compress(body)}
+                    else:
+                        fields = {b'd': body}
+                    pipe.xadd(stream, fields, maxlen=maxlen, approximate=True)
+                results = await pipe.execute()
+        except Exception as e:
+            raise MessageQueueError(f"Failed to append to stream {stream}: {str(e)}")
+        logger.debug("Stream batch appended", stream=stream, count=len(results))
+        return len(results)
+
     def consume(
         self,
         queue: Queue,
@@ -77,7 +226,7 @@ class MessageQueue:
                 self.connection,
                 queues=[queue],
                 callbacks=[callback],
-                accept=['json']
+                accept=['orjson', 'json']
             ) as consumer:
                 logger.info(
                     "Started consuming messages",
@@ -100,12 +249,88 @@ class MessageQueue:
         except Exception as e:
             raise MessageQueueError(f"Consumer error: {str(e)}")
 
+    async def consume_stream(
+        self,
+        stream: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        name: Optional[str] = None,
+        count: int = 100,
+        block_ms: int = 1000,
+        last_id: str = '$'
+    ) -> None:
+        """Consume messages appended to a Redis stream by stream_batch.
+        
+        Each XREAD returns up to ``count`` messages in one round trip. The
+        callback receives the decoded message and may be a coroutine
+        function. Runs until the task is cancelled.
+        """
+        is_async = inspect.iscoroutinefunction(callback)
+        decompress = self._zstd_decompressor.decompress
+        logger.info(
+            "Started consuming stream",
+            stream=stream,
+            consumer=name or 'default'
+        )
+        try:
+            while True:
+                response = await self.redis.xread(
+                    {stream: last_id}, count=count, block=block_ms
+                )
+                for _stream, messages in response:
+                    for message_id, fields in messages:
+                        last_id = message_id
+                        if b'z' in fields:
+                            message = orjson.loads(decompress(fields[b'z']))
+                        else:
+                            message = orjson.loads(fields[b'd'])
+                        if is_async:
+                            await callback(message)
+                        else:
+                            callback(message)
+        except asyncio.CancelledError:
+            logger.info("Stopped consuming stream", stream=stream, consumer=name)
+            raise
+        except Exception as e:
+            raise MessageQueueError(f"Stream consumer error: {str(e)}")
+
     def close(self) -> None:
         """Close the message queue connection."""
+        if self._redis is not None:
+            redis, self._redis = self._redis, None
+            self._close_redis(redis)
         if self._connection:
             self._connection.close()
             self._connection = None
             logger.info("Closed message queue connection")
 
-# Global message queue instance
-message_queue = MessageQueue()
\ No newline at end of file
+    def _close_redis(self, redis: Redis) -> None:
+        """Close the asyncio Redis client and its connection pool.
+        
+        Closing is a coroutine, so it is scheduled on the running event
+        loop when called from one, and run to completion otherwise.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        try:
+            if loop is not None:
+                task = loop.create_task(redis.aclose())
+                self._close_tasks.add(task)
+                task.add_done_callback(self._close_tasks.discard)
+            else:
+                asyncio.run(redis.aclose())
+        except Exception as e:
+            logger.warning("Failed to close Redis client", error=str(e))
+
+@lru_cache(maxsize=None)
+def get_message_queue() -> MessageQueue:
+    """Get the shared message queue, creating it on first use."""
+    return MessageQueue()
+
+def __getattr__(name: str) -> Any:
+    # Keep ``from slot_analyzer.message_broker import message_queue``
+    # working without building the queue at import time
+    if name == 'message_queue':
+        return get_message_queue()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
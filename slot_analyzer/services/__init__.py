@@ -3,6 +3,7 @@ Services layer for the slot analyzer application.
 Provides access to core functionality modules.
 """
 
+from .registry import ServiceRegistry, registry
 from .health import health_service  # Explicit import from health.py module
 from .capture import (
     SlotGameCapture,
@@ -15,16 +16,7 @@ __all__ = [
     'ProxyManager',
     'ScreenshotManager',
     'ServiceRegistry',
+    'registry',
     'health_service'
 ]
 
-
-class ServiceRegistry:
-    def __init__(self):
-        self.services = {}
-
-    def register(self, name, service):
-        self.services[name] = service
-
-    def get(self, name):
-        return self.services.get(name)
\ No newline at end of file
@@ -1,15 +1,16 @@
 """
 Core capture module implementation for slot game analysis.
 """
-from datetime import datetime
 import asyncio
-from typing import Dict, Optional
-from pathlib import Path
+import base64
+import time
+from typing import Callable, Dict, Optional
 
+import orjson
 from loguru import logger
-from pydantic import BaseModel
 from slot_analyzer.config.config import get_config
 
+from slot_analyzer.services.capture.types import CaptureData, SessionInfo, isoformat_ns
 from slot_analyzer.services.capture.proxy import ProxyManager
 from slot_analyzer.services.capture.screenshot import ScreenshotManager
 from slot_analyzer.errors import (
@@ -20,29 +21,15 @@ from slot_analyzer.errors import (
     ValidationError,
     ResourceError
 )
-from slot_analyzer.message_broker import MessageQueue
-
-class SessionInfo(BaseModel):
-    """Validates and stores session information"""
-    casino_name: str
-    game_name: str
-    session_id: Optional[str] = None
-    start_time: Optional[datetime] = None
-
-    def generate_session_id(self) -> str:
-        """Generate a unique session ID using the required format"""
-        if not self.start_time:
-            self.start_time = datetime.now()
-        timestamp = self.start_time.strftime("%Y%m%d-%H%M%S")
-        return f"{self.casino_name}-{self.game_name}-{timestamp}"
-
-class CaptureData(BaseModel):
-    """Data structure for captured network traffic and screenshots"""
-    timestamp: datetime
-    request_data: Dict
-    response_data: Optional[Dict]
-    screenshot_path: Optional[Path]
-    websocket_data: Optional[Dict]
+from slot_analyzer.message_broker import get_message_queue
+from slot_analyzer.services.registry import registry
+
+def _json_default(obj):
+    """Serialize values orjson has no native form for"""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        # Raw WebSocket frames are published losslessly as base64
+        return base64.b64encode(obj).decode("ascii")
+    return str(obj)
 
 class SlotGameCapture:
     """Main capture class handling network traffic and screenshots"""
@@ -54,20 +41,30 @@ class SlotGameCapture:
             if not self.session.session_id:
                 self.session.session_id = self.session.generate_session_id()
 
+            # The broker connection is shared by all sessions. The proxy is
+            # per session because each session starts, stops and handles its
+            # own traffic; screenshots write to the session's directory
             self.proxy_manager = ProxyManager()
             config = get_config()
             self.screenshot_manager = ScreenshotManager(
                 session_id=self.session.session_id,
                 throttle_ms=config.capture.screenshot_throttle_ms
             )
-            self.message_queue = MessageQueue()
+            self.message_queue = registry.get_or_create(
+                "message_queue", get_message_queue
+            )
         except Exception as e:
             raise ValidationError(
                 "Invalid session configuration",
                 input_type="session_info",
                 value=session_info
             ).with_recovery("Verify session parameters and try again") from e
-        self.captures: list[CaptureData] = []
+        self._encode_capture = self._build_encoder()
+        # Handlers feed the publisher through this queue; None is the
+        # stop sentinel put by stop_capture
+        self._capture_q: asyncio.Queue[Optional[CaptureData]] = asyncio.Queue()
+        # Most recent capture, for associating responses with requests
+        self._last_capture: Optional[CaptureData] = None
         self._running = False
 
     async def start_capture(self):
@@ -140,6 +137,7 @@ class SlotGameCapture:
             return
 
         self._running = False
+        self._capture_q.put_nowait(None)
         logger.info(
             "Stopping capture session",
             session_id=self.session.session_id
@@ -197,41 +195,35 @@ class SlotGameCapture:
             return
 
         try:
-            # Validate request data
-            if not isinstance(request_data, dict) or not request_data:
-                raise ValidationError(
-                    "Invalid request data format",
-                    field="request_data",
-                    value=type(request_data)
-                )
+            # The proxy always hands over a populated dict; keep the check
+            # for development runs only, python -O strips it
+            if __debug__:
+                if not isinstance(request_data, dict) or not request_data:
+                    raise ValidationError(
+                        "Invalid request data format",
+                        field="request_data",
+                        value=type(request_data)
+                    )
 
-            timestamp = datetime.now()
+            timestamp_ns = time.time_ns()
             
-            # Capture screenshot with error handling
-            try:
-                screenshot_path = await self.screenshot_manager.capture()
-            except Exception as e:
-                logger.error(
-                    "Failed to capture screenshot for request",
-                    request_data=request_data,
-                    error=str(e),
-                    error_type=e.__class__.__name__
-                )
-                screenshot_path = None
+            # ScreenshotManager logs its own failures and returns None
+            screenshot_path = await self.screenshot_manager.capture()
 
             capture = CaptureData(
-                timestamp=timestamp,
+                timestamp_ns=timestamp_ns,
                 request_data=request_data,
                 response_data=None,
                 screenshot_path=screenshot_path,
                 websocket_data=None
             )
             
-            self.captures.append(capture)
+            self._last_capture = capture
+            self._capture_q.put_nowait(capture)
             logger.debug(
                 "Successfully captured request",
                 request_id=request_data.get('id'),
-                timestamp=timestamp.isoformat()
+                timestamp_ns=timestamp_ns
             )
 
         except ValidationError as e:
@@ -248,11 +240,6 @@ class SlotGameCapture:
                 error=str(e),
                 error_type=e.__class__.__name__
             )
-            raise CaptureError(
-                "Request handling failed",
-                component="request_handler",
-                request_id=request_data.get('id')
-            ).with_recovery("Check request processing pipeline") from e
 
     async def _handle_response(self, response_data: Dict):
         """Handle intercepted HTTP/HTTPS responses"""
@@ -263,7 +250,7 @@ class SlotGameCapture:
             )
             return
             
-        if not self.captures:
+        if self._last_capture is None:
             logger.warning(
                 "Received response with no pending captures",
                 response_data=response_data
@@ -271,20 +258,21 @@ class SlotGameCapture:
             return
 
         try:
-            # Validate response data
-            if not isinstance(response_data, dict) or not response_data:
-                raise ValidationError(
-                    "Invalid response data format",
-                    field="response_data",
-                    value=type(response_data)
-                )
+            # Development-only check, as in _handle_request
+            if __debug__:
+                if not isinstance(response_data, dict) or not response_data:
+                    raise ValidationError(
+                        "Invalid response data format",
+                        field="response_data",
+                        value=type(response_data)
+                    )
 
             # Associate response with the most recent capture
-            self.captures[-1].response_data = response_data
+            self._last_capture.response_data = response_data
             logger.debug(
                 "Successfully processed response",
                 response_id=response_data.get('id'),
-                timestamp=self.captures[-1].timestamp.isoformat()
+                timestamp_ns=self._last_capture.timestamp_ns
             )
 
         except ValidationError as e:
@@ -301,11 +289,6 @@ class SlotGameCapture:
                 error=str(e),
                 error_type=e.__class__.__name__
             )
-            raise CaptureError(
-                "Response handling failed",
-                component="response_handler",
-                response_id=response_data.get('id')
-            ).with_recovery("Check response processing pipeline") from e
 
     async def _handle_websocket(self, websocket_data: Dict):
         """Handle WebSocket messages"""
@@ -317,41 +300,34 @@ class SlotGameCapture:
             return
 
         try:
-            # Validate WebSocket data
-            if not isinstance(websocket_data, dict) or not websocket_data:
-                raise ValidationError(
-                    "Invalid WebSocket data format",
-                    field="websocket_data",
-                    value=type(websocket_data)
-                )
+            # Development-only check, as in _handle_request
+            if __debug__:
+                if not isinstance(websocket_data, dict) or not websocket_data:
+                    raise ValidationError(
+                        "Invalid WebSocket data format",
+                        field="websocket_data",
+                        value=type(websocket_data)
+                    )
 
-            timestamp = datetime.now()
+            timestamp_ns = time.time_ns()
             
-            # Capture screenshot with error handling
-            try:
-                screenshot_path = await self.screenshot_manager.capture()
-            except Exception as e:
-                logger.error(
-                    "Failed to capture screenshot for WebSocket message",
-                    websocket_data=websocket_data,
-                    error=str(e),
-                    error_type=e.__class__.__name__
-                )
-                screenshot_path = None
+            # ScreenshotManager logs its own failures and returns None
+            screenshot_path = await self.screenshot_manager.capture()
 
             capture = CaptureData(
-                timestamp=timestamp,
+                timestamp_ns=timestamp_ns,
                 request_data={},
                 response_data=None,
                 screenshot_path=screenshot_path,
                 websocket_data=websocket_data
             )
             
-            self.captures.append(capture)
+            self._last_capture = capture
+            self._capture_q.put_nowait(capture)
             logger.debug(
                 "Successfully processed WebSocket message",
                 message_type=websocket_data.get('type'),
-                timestamp=timestamp.isoformat()
+                timestamp_ns=timestamp_ns
             )
 
         except ValidationError as e:
@@ -368,52 +344,90 @@ class SlotGameCapture:
                 error=str(e),
                 error_type=e.__class__.__name__
             )
-            raise CaptureError(
-                "WebSocket handling failed",
-                component="websocket_handler",
-                message_type=websocket_data.get('type')
-            ).with_recovery("Check WebSocket processing pipeline") from e
 
     async def _process_captures(self):
-        """Process and queue captured data"""
+        """Process and queue captured data in batches"""
+        config = get_config().capture
+        batch_max = config.publish_batch_size
+        batch_wait = config.publish_batch_ms / 1000
+        queue = self._capture_q
         while self._running:
-            if self.captures:
-                capture = self.captures.pop(0)
-                await self.message_queue.publish(
-                    "captures",
-                    {
-                        "session_id": self.session.session_id,
-                        "timestamp": capture.timestamp.isoformat(),
-                        "data": capture.dict()
-                    }
-                )
-            await asyncio.sleep(0.1)
+            capture = await queue.get()
+            if capture is None:
+                break
+
+            # Give a partial batch a short window to fill up, which also
+            # lets the matching response attach before publishing
+            if queue.qsize() < batch_max - 1:
+                await asyncio.sleep(batch_wait)
+
+            batch = [capture]
+            try:
+                while len(batch) < batch_max:
+                    capture = queue.get_nowait()
+                    if capture is None:
+                        break
+                    batch.append(capture)
+            except asyncio.QueueEmpty:
+                pass
+            await self._publish_batch(batch)
+
+    async def _publish_batch(self, batch: list[CaptureData]) -> None:
+        """Append a batch of captures to the captures stream in one round trip"""
+        try:
+            await self.message_queue.stream_batch(
+                "captures",
+                [self._encode_capture(capture) for capture in batch]
+            )
+        except MessageQueueError as e:
+            logger.error(
+                "Failed to publish capture batch",
+                session_id=self.session.session_id,
+                batch_size=len(batch),
+                error=str(e),
+                error_type=e.__class__.__name__
+            )
+            for capture in batch:
+                self._store_failed_capture(capture)
+
+    def _build_encoder(self) -> Callable[[CaptureData], bytes]:
+        """Build the capture encoder specialized to this session
+
+        The session fields never change, so they are serialized once into
+        a prefix and each capture only encodes its own timestamp and data.
+        """
+        session_fields = orjson.dumps({
+            "session_id": self.session.session_id,
+            "casino_name": self.session.casino_name,
+            "game_name": self.session.game_name
+        })
+        prefix = session_fields[:-1] + b',"timestamp":"'
+        dumps = orjson.dumps
+        join = b"".join
+
+        def encode(capture: CaptureData) -> bytes:
+            """Encode a capture as the JSON message body published to the queue"""
+            return join((
+                prefix,
+                isoformat_ns(capture.timestamp_ns).encode(),
+                b'","data":',
+                dumps(capture, default=_json_default),
+                b"}"
+            ))
+
+        return encode
 
     async def _cleanup(self):
         """Cleanup resources and save any remaining captures"""
         try:
-            # Process any remaining captures
-            while self.captures:
-                capture = self.captures.pop(0)
-                try:
-                    await self.message_queue.publish(
-                        "captures",
-                        {
-                            "session_id": self.session.session_id,
-                            "timestamp": capture.timestamp.isoformat(),
-                            "data": capture.dict()
-                        }
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Failed to publish capture data",
-                        session_id=self.session.session_id,
-                        timestamp=capture.timestamp.isoformat(),
-                        error=str(e),
-                        error_type=e.__class__.__name__
-                    )
-                    # Store failed captures for retry
-                    self._store_failed_capture(capture)
+            # Publish any remaining captures as one final batch
+            remaining = []
+            while not self._capture_q.empty():
+                capture = self._capture_q.get_nowait()
+                if capture is not None:
+                    remaining.append(capture)
+            if remaining:
+                await self._publish_batch(remaining)
 
             logger.info(
                 "Cleanup completed for session",
@@ -3,12 +3,11 @@ Proxy management module for intercepting network traffic.
 """
 from pathlib import Path
 import asyncio
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Set
 import ssl
-from datetime import datetime
+import time
 
 from mitmproxy import ctx, options
-from .options import Options
 from mitmproxy.tools import dump
 from mitmproxy import proxy
 from OpenSSL import crypto
@@ -54,13 +53,32 @@ class CertificateManager:
         logger.info(f"Generated new CA certificate at {self.ca_cert_path}")
 
 class MitmproxyController(dump.DumpMaster):
-    """Custom mitmproxy controller for handling traffic"""
+    """Custom mitmproxy controller for handling traffic
+    
+    Hooks only enqueue the flow; a single consumer task builds the
+    handler payloads in arrival order and runs the handlers as a few
+    concurrent tasks, so mitmproxy's own I/O is never held up by capture
+    work.
+    """
+
+    # Flows waiting for the consumer; further flows are dropped when full
+    QUEUE_SIZE = 1024
+    # Handlers allowed to run at once
+    HANDLER_CONCURRENCY = 4
+    # Bodies declared larger than this are streamed through unbuffered
+    # and captured without their content
+    BODY_CAPTURE_LIMIT = 1_000_000
 
     def __init__(self, opts: options.Options):
         super().__init__(opts)
         self._request_handler: Optional[Callable] = None
         self._response_handler: Optional[Callable] = None
         self._websocket_handler: Optional[Callable] = None
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._consumer: Optional[asyncio.Task] = None
+        self._handler_slots = asyncio.Semaphore(self.HANDLER_CONCURRENCY)
+        self._handler_tasks: Set[asyncio.Task] = set()
+        self._dropped = 0
 
     def set_handlers(self,
                     request_handler: Callable,
@@ -71,39 +89,117 @@ class MitmproxyController(dump.DumpMaster):
         self._response_handler = response_handler
         self._websocket_handler = websocket_handler
 
+    def requestheaders(self, flow):
+        """Stream large request bodies instead of buffering them"""
+        if self._exceeds_capture_limit(flow.request):
+            flow.request.stream = True
+
+    def responseheaders(self, flow):
+        """Stream large response bodies instead of buffering them"""
+        if self._exceeds_capture_limit(flow.response):
+            flow.response.stream = True
+
+    def _exceeds_capture_limit(self, message) -> bool:
+        """Check the declared body size against the capture limit"""
+        try:
+            return int(message.headers.get("content-length", 0)) > self.BODY_CAPTURE_LIMIT
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _body_text(message) -> Optional[str]:
+        """Decode a buffered body, or None if it was streamed through"""
+        if message.raw_content is None:
+            return None
+        return message.content.decode('utf-8', 'ignore')
+
     def request(self, flow):
         """Process intercepted requests"""
         if self._request_handler:
-            request_data = {
-                "method": flow.request.method,
-                "url": flow.request.pretty_url,
-                "headers": dict(flow.request.headers),
-                "content": flow.request.content.decode('utf-8', 'ignore'),
-                "timestamp": datetime.now().isoformat()
-            }
-            asyncio.create_task(self._request_handler(request_data))
+            self._enqueue("request", flow)
 
     def response(self, flow):
         """Process intercepted responses"""
         if self._response_handler:
-            response_data = {
-                "status_code": flow.response.status_code,
-                "headers": dict(flow.response.headers),
-                "content": flow.response.content.decode('utf-8', 'ignore'),
-                "timestamp": datetime.now().isoformat()
-            }
-            asyncio.create_task(self._response_handler(response_data))
+            self._enqueue("response", flow)
 
     def websocket_message(self, flow):
         """Process WebSocket messages"""
+        # The hook fires once per message, which is the last one recorded
         if self._websocket_handler and flow.websocket:
-            for message in flow.websocket.messages:
-                websocket_data = {
-                    "type": "send" if message.from_client else "receive",
-                    "content": message.content.decode('utf-8', 'ignore'),
-                    "timestamp": datetime.now().isoformat()
-                }
-                asyncio.create_task(self._websocket_handler(websocket_data))
+            self._enqueue("websocket", flow.websocket.messages[-1])
+
+    def _enqueue(self, kind: str, item) -> None:
+        """Queue a flow or message for the consumer task"""
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._drain())
+        try:
+            self._queue.put_nowait((kind, item, time.time_ns()))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped % 100 == 1:
+                logger.warning(f"Capture queue full, dropped {self._dropped} flows so far")
+
+    async def _drain(self) -> None:
+        """Build handler payloads from queued flows and start the handlers"""
+        while True:
+            # Wall-clock nanoseconds; formatted only if a consumer needs text
+            kind, item, timestamp_ns = await self._queue.get()
+            try:
+                if kind == "request":
+                    handler = self._request_handler
+                    payload = {
+                        "method": item.request.method,
+                        "url": item.request.pretty_url,
+                        "headers": dict(item.request.headers),
+                        "content": self._body_text(item.request),
+                        "timestamp_ns": timestamp_ns
+                    }
+                elif kind == "response":
+                    handler = self._response_handler
+                    payload = {
+                        "status_code": item.response.status_code,
+                        "headers": dict(item.response.headers),
+                        "content": self._body_text(item.response),
+                        "timestamp_ns": timestamp_ns
+                    }
+                else:
+                    # Frames may be binary, so the body is passed through
+                    # undecoded and base64-encoded when the capture is published
+                    handler = self._websocket_handler
+                    payload = {
+                        "type": "send" if item.from_client else "receive",
+                        "content": item.content,
+                        "content_encoding": "base64",
+                        "timestamp_ns": timestamp_ns
+                    }
+            except Exception as e:
+                logger.error(f"Capture payload failed for {kind}: {str(e)}")
+                continue
+            
+            # Handlers wait on screenshot I/O, so several run at once and a
+            # flow is not held up behind earlier flows' screenshots
+            await self._handler_slots.acquire()
+            task = asyncio.create_task(self._run_handler(kind, handler, payload))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
+    async def _run_handler(self, kind: str, handler: Callable, payload: Dict) -> None:
+        """Run one handler, freeing its slot when it finishes"""
+        try:
+            await handler(payload)
+        except Exception as e:
+            logger.error(f"Capture handler failed for {kind}: {str(e)}")
+        finally:
+            self._handler_slots.release()
+
+    def stop_consumer(self) -> None:
+        """Cancel the consumer task and running handlers, discarding any queued flows"""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+        for task in list(self._handler_tasks):
+            task.cancel()
 
 class ProxyManager:
     """Manages the mitmproxy instance for traffic interception"""
@@ -136,11 +232,14 @@ class ProxyManager:
             self.cert_manager.generate_ca_cert()
 
             # Configure mitmproxy options
-            opts = Options(
+            opts = options.Options(
                 listen_host=self.proxy_host,
                 listen_port=self.proxy_port,
                 ssl_insecure=True,  # Accept invalid certificates
-                cadir=str(self.cert_manager.cert_dir)
+                cadir=str(self.cert_manager.cert_dir),
+                # Stream bodies past the capture limit through, including
+                # ones without a declared length
+                stream_large_bodies=str(MitmproxyController.BODY_CAPTURE_LIMIT)
             )
 
             # Initialize proxy server
@@ -165,6 +264,7 @@ class ProxyManager:
         """Stop the proxy server"""
         if self._controller:
             try:
+                self._controller.stop_consumer()
                 await self._controller.shutdown()
                 self._controller = None
                 logger.info("Proxy server stopped")
@@ -2,18 +2,28 @@
 Screenshot capture management module with throttling and storage.
 """
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import time
 from typing import Optional
 
+import cv2
+import numpy as np
 import pyautogui
 from loguru import logger
-from PIL import Image
 
 from slot_analyzer.errors import CaptureError
 from slot_analyzer.config import settings
 
+# mss grabs the screen through native bindings into a raw buffer, where
+# pyautogui goes through PIL's ImageGrab and, on macOS and Linux, spawns a
+# screencapture/xwd subprocess per frame; it is optional
+try:
+    import mss
+except ImportError:
+    mss = None
+
 class ScreenshotManager:
     """Manages screenshot captures with throttling"""
 
@@ -29,7 +39,12 @@ class ScreenshotManager:
         self.session_dir = self.base_dir / session_id
         self.throttle_ms = throttle_ms
         self._last_capture = 0
+        self._in_flight: Optional[asyncio.Future] = None
         self._running = False
+        # Grabbing and encoding block, so they run on workers created by start()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # mss handles are not thread-safe, so each worker keeps its own
+        self._grabbers = threading.local()
         
         # Ensure screenshot directory exists
         self.session_dir.mkdir(parents=True, exist_ok=True)
@@ -44,6 +59,7 @@ class ScreenshotManager:
             raise CaptureError("Screenshot manager already running")
 
         self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
         logger.info(f"Started screenshot manager for session: {self.session_dir.name}")
 
     async def stop(self):
@@ -53,74 +69,119 @@ class ScreenshotManager:
 
         self._running = False
         await self._cleanup()
+        self._executor.shutdown(wait=False)
         logger.info("Screenshot manager stopped")
 
     async def capture(self) -> Optional[Path]:
         """
         Capture a screenshot if throttling allows.
         
+        Callers arriving while a screenshot is being taken share that
+        screenshot instead of triggering a new one. Within the throttle
+        window after it, no screenshot is returned: the last one was taken
+        before the caller's flow and would show an earlier screen.
+        
         Returns:
-            Path to the captured screenshot file or None if throttled
+            Path to the captured screenshot file or None if unavailable
         """
         if not self._running:
             return None
 
-        current_time = time.time() * 1000  # Convert to milliseconds
-        time_since_last = current_time - self._last_capture
+        if self._in_flight is not None:
+            return await asyncio.shield(self._in_flight)
 
-        if time_since_last < self.throttle_ms:
+        current_time = asyncio.get_running_loop().time() * 1000  # Milliseconds
+        if current_time - self._last_capture < self.throttle_ms:
             return None
 
+        self._last_capture = current_time
+        self._in_flight = asyncio.ensure_future(self._take_screenshot())
         try:
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
-            screenshot_path = self.session_dir / f"capture_{timestamp}.png"
-
-            # Capture and save screenshot
-            screenshot = pyautogui.screenshot()
-            
-            # Validate screenshot
-            if not self._validate_screenshot(screenshot):
-                logger.warning("Invalid screenshot captured, skipping")
-                return None
-
-            # Save with compression
-            screenshot.save(
-                screenshot_path,
-                format="PNG",
-                optimize=True,
-                compression_level=6
-            )
-
-            self._last_capture = current_time
-            logger.debug(f"Screenshot captured: {screenshot_path.name}")
-            
-            return screenshot_path
+            return await asyncio.shield(self._in_flight)
+        finally:
+            self._in_flight = None
 
+    async def _take_screenshot(self) -> Optional[Path]:
+        """
+        Take, validate and save a single screenshot.
+        
+        Grabbing and PNG encoding are blocking, so they run in a worker
+        thread to keep the proxy handlers responsive.
+        
+        Returns:
+            Path to the saved screenshot file or None on failure
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._grab_and_save)
         except Exception as e:
             logger.error(f"Screenshot capture failed: {str(e)}")
             return None
 
-    def _validate_screenshot(self, screenshot: Image.Image) -> bool:
+    def _grab_and_save(self) -> Optional[Path]:
+        """Grab the screen and write it to the session directory."""
+        # Generate filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        screenshot_path = self.session_dir / f"capture_{timestamp}.png"
+
+        # Capture and save screenshot
+        frame = self._grab()
+
+        # Validate screenshot
+        if not self._validate_screenshot(frame):
+            logger.warning("Invalid screenshot captured, skipping")
+            return None
+
+        # Encode with OpenCV's libpng at zlib level 1; unlike PIL's save it
+        # releases the GIL, so both workers can encode at once
+        ok, encoded = cv2.imencode(".png", frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise CaptureError(f"Failed to encode screenshot: {screenshot_path.name}")
+        encoded.tofile(str(screenshot_path))
+
+        logger.debug(f"Screenshot captured: {screenshot_path.name}")
+        
+        return screenshot_path
+
+    def _grab(self) -> np.ndarray:
+        """Grab the primary monitor as a BGR pixel array."""
+        if mss is None:
+            return cv2.cvtColor(np.asarray(pyautogui.screenshot()), cv2.COLOR_RGB2BGR)
+
+        grabber = getattr(self._grabbers, "sct", None)
+        if grabber is None:
+            grabber = self._grabbers.sct = mss.mss()
+        raw = grabber.grab(grabber.monitors[1])
+        bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+
+    # Number of pixels sampled when checking for a solid-color frame
+    VALIDATION_SAMPLE = 4096
+
+    def _validate_screenshot(self, pixels: np.ndarray) -> bool:
         """
         Validate captured screenshot.
         
         Args:
-            screenshot: PIL Image object to validate
+            pixels: The screenshot's pixel array, shared with the encoder
         
         Returns:
             bool: True if screenshot is valid
         """
         # Check for minimum dimensions
-        if screenshot.width < 100 or screenshot.height < 100:
+        height, width = pixels.shape[:2]
+        if width < 100 or height < 100:
             return False
 
-        # Check if image is completely black or white
-        extrema = screenshot.convert("L").getextrema()
-        if extrema[0] == extrema[1]:  # Same min/max means solid color
-            return False
+        # Reject solid-color frames. Any variation in an evenly strided
+        # sample accepts the frame cheaply; a uniform sample may still miss
+        # detail between strides, so only then is every pixel compared
+        flat = pixels.reshape(-1, pixels.shape[-1]) if pixels.ndim == 3 else pixels.reshape(-1)
+        sample = flat[::max(1, len(flat) // self.VALIDATION_SAMPLE)]
+        if not (sample == sample[0]).all():
+            return True
 
-        return True
+        return not (flat == flat[0]).all()
 
     async def _cleanup(self):
         """Cleanup any temporary files"""
@@ -0,0 +1,63 @@
+"""
+Data types shared by the capture service.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+from pathlib import Path
+
+from pydantic import BaseModel
+
+class SessionInfo(BaseModel):
+    """Validates and stores session information"""
+    casino_name: str
+    game_name: str
+    session_id: Optional[str] = None
+    start_time: Optional[datetime] = None
+
+    def generate_session_id(self) -> str:
+        """Generate a unique session ID using the required format
+
+        The ID is stored on the session, so later calls return it as is.
+        """
+        if self.session_id:
+            return self.session_id
+        if not self.start_time:
+            self.start_time = datetime.now()
+        t = self.start_time
+        self.session_id = (
+            f"{self.casino_name}-{self.game_name}-"
+            f"{t.year:04d}{t.month:02d}{t.day:02d}-{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        )
+        return self.session_id
+
+@lru_cache(maxsize=2)
+def _isoformat_second(seconds: int) -> str:
+    """Format a whole second as a local ISO 8601 string"""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+def isoformat_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string
+
+    The date and time part is formatted once per second; only the
+    microseconds are formatted per call.
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    micros = nanos // 1000
+    prefix = _isoformat_second(seconds)
+    # Matches datetime.isoformat, which omits a zero fraction
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+@dataclass(slots=True)
+class CaptureData:
+    """Data structure for captured network traffic and screenshots
+
+    Built only from handler data that has already been validated, so it
+    skips pydantic model validation.
+    """
+    timestamp_ns: int  # Wall-clock time from time.time_ns()
+    request_data: Dict
+    response_data: Optional[Dict] = None
+    screenshot_path: Optional[Path] = None
+    websocket_data: Optional[Dict] = None
@@ -1,18 +1,23 @@
 """Pattern analysis implementation for slot game data."""
 
+from collections import Counter
+from itertools import chain
 from typing import Dict, List, Any, Optional
 import numpy as np
-import pandas as pd
 from scipy import stats
 from dataclasses import dataclass
 from datetime import datetime
 
-from slot_analyzer.message_broker import message_queue, event_exchange
+from slot_analyzer.message_broker import get_message_queue, event_exchange
 from slot_analyzer.log_utils import get_logger
 from slot_analyzer.errors import AnalysisError
 
 logger = get_logger(__name__)
 
+# Capture fields used by the analysis, gathered into one array each
+Columns = Dict[str, np.ndarray]
+ANALYZED_FIELDS = ('bet_size', 'outcome', 'symbols')
+
 @dataclass
 class AnalysisResult:
     """Container for pattern analysis results."""
@@ -44,26 +49,26 @@ class PatternAnalyzer:
             AnalysisError: If analysis fails due to invalid data or processing error
         """
         try:
-            # Convert captures to DataFrame for analysis
-            df = pd.DataFrame(captures)
+            # Gather the analyzed fields into arrays
+            cols = self._gather_columns(captures)
             
             # Calculate bet size and outcome correlation
-            bet_correlation = self._analyze_bet_correlation(df)
+            bet_correlation = self._analyze_bet_correlation(cols)
             
             # Analyze symbol frequencies and combinations
-            symbol_freqs = self._analyze_symbol_frequencies(df)
+            symbol_freqs = self._analyze_symbol_frequencies(cols)
             
             # Detect response patterns
-            patterns = self._detect_response_patterns(df)
+            patterns = self._detect_response_patterns(cols)
             
             # Calculate statistical significance
-            stats_sig = self._calculate_significance(df)
+            stats_sig = self._calculate_significance(cols)
             
             # Detect statistical anomalies
-            anomalies = self._detect_anomalies(df)
+            anomalies = self._detect_anomalies(cols)
             
             result = AnalysisResult(
-                session_id=df.iloc[0].get('session_id', 'unknown'),
+                session_id=captures[0].get('session_id', 'unknown'),
                 timestamp=datetime.now(),
                 bet_outcome_correlation=bet_correlation,
                 symbol_frequencies=symbol_freqs,
@@ -80,30 +85,66 @@ class PatternAnalyzer:
         except Exception as e:
             raise AnalysisError(f"Pattern analysis failed: {str(e)}")
 
-    def _analyze_bet_correlation(self, df: pd.DataFrame) -> float:
+    def _gather_columns(self, captures: List[Dict[str, Any]]) -> Columns:
+        """Gather the analyzed capture fields into one array per field.
+        
+        Only fields present in at least one capture get a column. Missing
+        values are None, or NaN in numeric columns.
+        """
+        cols = {}
+        for field in ANALYZED_FIELDS:
+            values = [capture.get(field) for capture in captures]
+            if all(value is None for value in values):
+                continue
+            if field == 'symbols':
+                # Ragged lists need an explicit object array
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            else:
+                column = np.array(values)
+                if column.dtype == object:
+                    try:
+                        column = np.array(values, dtype=float)
+                    except (TypeError, ValueError):
+                        pass
+            cols[field] = column
+        return cols
+
+    def _analyze_bet_correlation(self, cols: Columns) -> float:
         """Calculate correlation between bet sizes and outcomes."""
-        if 'bet_size' not in df.columns or 'outcome' not in df.columns:
+        if 'bet_size' not in cols or 'outcome' not in cols:
             return 0.0
-        return float(df['bet_size'].corr(df['outcome']))
+        bets = cols['bet_size'].astype(float)
+        outcomes = cols['outcome'].astype(float)
+        
+        # Pearson correlation over the captures that have both values
+        valid = ~(np.isnan(bets) | np.isnan(outcomes))
+        if valid.sum() < 2:
+            return float('nan')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.corrcoef(bets[valid], outcomes[valid])[0, 1])
 
-    def _analyze_symbol_frequencies(self, df: pd.DataFrame) -> Dict[str, float]:
+    def _analyze_symbol_frequencies(self, cols: Columns) -> Dict[str, float]:
         """Analyze frequency distribution of symbols."""
-        if 'symbols' not in df.columns:
+        if 'symbols' not in cols:
             return {}
             
-        # Flatten symbol lists and calculate frequencies
-        all_symbols = [s for symbols in df['symbols'] for s in symbols]
-        freq_series = pd.Series(all_symbols).value_counts(normalize=True)
-        return freq_series.to_dict()
+        # Count symbols straight from the nested lists without flattening
+        # them into an intermediate list first
+        counts = Counter(chain.from_iterable(
+            symbols for symbols in cols['symbols'] if symbols is not None
+        ))
+        total = sum(counts.values())
+        return {symbol: count / total for symbol, count in counts.most_common()}
 
-    def _detect_response_patterns(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_response_patterns(self, cols: Columns) -> List[Dict[str, Any]]:
         """Detect recurring patterns in game responses."""
         patterns = []
-        if len(df) < 3:  # Need minimum sequence for pattern detection
+        outcomes = cols.get('outcome')
+        if outcomes is None or len(outcomes) < 3:  # Need minimum sequence for pattern detection
             return patterns
             
         # Analyze sequences of outcomes
-        outcomes = df['outcome'].tolist()
         for window in range(2, min(6, len(outcomes))):
             pattern_counts = self._find_sequences(outcomes, window)
             if pattern_counts:
@@ -114,46 +155,85 @@ class PatternAnalyzer:
         
         return patterns
 
-    def _find_sequences(self, data: List[Any], window: int) -> Dict[str, int]:
-        """Find recurring sequences of specified window size."""
-        sequences = {}
-        for i in range(len(data) - window + 1):
-            seq = tuple(data[i:i+window])
-            sequences[str(seq)] = sequences.get(str(seq), 0) + 1
+    def _find_sequences(self, data: np.ndarray, window: int) -> Dict[str, int]:
+        """Find recurring sequences of specified window size.
+        
+        Keys are the string form of each sequence tuple so the result
+        stays JSON-serializable for publishing.
+        """
+        if data.dtype == object:
+            # Mixed values can't be compared row-wise by np.unique
+            counts = Counter(zip(*(data[i:] for i in range(window))))
+            return {str(seq): n for seq, n in counts.items() if n > 1}
+
+        # Factorize the values and pack each window's codes into one
+        # integer, so windows are counted with a flat 1-D np.unique rather
+        # than a row-wise unique over a 2-D array. NaNs stay distinct, so
+        # windows containing one never repeat.
+        values, codes = np.unique(data, return_inverse=True, equal_nan=False)
+        base = max(len(values), 1)
+        if base ** window >= 2 ** 63:
+            windows = np.lib.stride_tricks.sliding_window_view(data, window)
+            sequences, counts = np.unique(windows, axis=0, return_counts=True)
+        else:
+            codes = codes.reshape(-1).astype(np.int64)
+            span = len(codes) - window + 1
+            keys = codes[:span].copy()
+            for offset in range(1, window):
+                keys *= base
+                keys += codes[offset:offset + span]
+            keys, counts = np.unique(keys, return_counts=True)
+            
+            # Unpack the codes of each distinct window, last position first
+            digits = np.empty((len(keys), window), dtype=np.int64)
+            for position in range(window - 1, -1, -1):
+                keys, digits[:, position] = np.divmod(keys, base)
+            sequences = values[digits]
         
         # Filter for significant patterns (occurring more than once)
-        return {k: v for k, v in sequences.items() if v > 1}
+        repeated = counts > 1
+        return {
+            str(tuple(seq)): int(count)
+            for seq, count in zip(sequences[repeated].tolist(), counts[repeated])
+        }
 
-    def _calculate_significance(self, df: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_significance(self, cols: Columns) -> Dict[str, float]:
         """Calculate statistical significance of observed patterns."""
         results = {}
         
-        if 'outcome' in df.columns:
-            # Chi-square test for outcome distribution
-            observed = df['outcome'].value_counts()
-            expected = pd.Series([len(df)/len(observed)] * len(observed), 
-                               index=observed.index)
-            chi_square_stat, p_value = stats.chi2_contingency([observed, expected])
+        if 'outcome' in cols:
+            # Chi-square goodness-of-fit against a uniform outcome distribution
+            observed = self._count_values(cols['outcome'])
+            expected = np.full(len(observed), observed.sum() / len(observed))
+            _, p_value = stats.chisquare(observed, f_exp=expected)
             results['outcome_distribution'] = float(p_value)
             
-        if 'bet_size' in df.columns and 'outcome' in df.columns:
-            # T-test for bet size difference between wins/losses
-            wins = df[df['outcome'] > 0]['bet_size']
-            losses = df[df['outcome'] <= 0]['bet_size']
+        if 'bet_size' in cols and 'outcome' in cols:
+            # Welch's t-test for bet size difference between wins/losses
+            won = cols['outcome'] > 0
+            bets = cols['bet_size']
+            wins, losses = bets[won], bets[~won]
             if len(wins) > 0 and len(losses) > 0:
-                _, p_value = stats.ttest_ind(wins, losses)
+                _, p_value = stats.ttest_ind(wins, losses, equal_var=False)
                 results['bet_size_difference'] = float(p_value)
                 
         return results
 
-    def _detect_anomalies(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _count_values(self, column: np.ndarray) -> np.ndarray:
+        """Count occurrences of each distinct value, ignoring missing values."""
+        if column.dtype == object:
+            return np.array(list(Counter(v for v in column if v is not None).values()))
+        if column.dtype.kind == 'f':
+            column = column[~np.isnan(column)]
+        return np.unique(column, return_counts=True)[1]
+
+    def _detect_anomalies(self, cols: Columns) -> List[Dict[str, Any]]:
         """Detect statistical anomalies in the game data."""
         anomalies = []
         
-        if 'outcome' in df.columns:
+        if 'outcome' in cols:
             # Detect unusual winning/losing streaks
-            outcomes = df['outcome'].tolist()
-            streaks = self._find_streaks(outcomes)
+            streaks = self._find_streaks(cols['outcome'])
             for streak in streaks:
                 if abs(streak['length']) > 5:  # Threshold for unusual streak
                     anomalies.append({
@@ -165,30 +245,29 @@ class PatternAnalyzer:
                     
         return anomalies
 
-    def _find_streaks(self, data: List[float]) -> List[Dict[str, Any]]:
+    def _find_streaks(self, data: np.ndarray) -> List[Dict[str, Any]]:
         """Find continuous streaks in the data."""
-        streaks = []
-        current_streak = {'value': None, 'length': 0, 'start': 0}
-        
-        for i, value in enumerate(data):
-            if current_streak['value'] is None:
-                current_streak = {'value': value, 'length': 1, 'start': i}
-            elif value == current_streak['value']:
-                current_streak['length'] += 1
-            else:
-                if current_streak['length'] > 3:  # Min streak length
-                    streaks.append(current_streak.copy())
-                current_streak = {'value': value, 'length': 1, 'start': i}
-                
-        if current_streak['length'] > 3:
-            streaks.append(current_streak)
+        if len(data) == 0:
+            return []
             
-        return streaks
+        # Run-length encode: a run starts wherever the value changes
+        starts = np.r_[0, np.flatnonzero(data[1:] != data[:-1]) + 1]
+        lengths = np.diff(np.r_[starts, len(data)])
+        
+        mask = lengths > 3  # Min streak length
+        return [
+            {'value': value, 'length': length, 'start': start}
+            for value, length, start in zip(
+                data[starts[mask]].tolist(),
+                lengths[mask].tolist(),
+                starts[mask].tolist()
+            )
+        ]
 
     def _publish_results(self, result: AnalysisResult) -> None:
         """Publish analysis results to the event queue."""
         try:
-            message_queue.publish(
+            get_message_queue().publish(
                 payload={
                     'type': 'pattern_analysis',
                     'session_id': result.session_id,
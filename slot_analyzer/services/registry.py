@@ -0,0 +1,45 @@
+"""
+Process-wide registry of shared service instances.
+"""
+from typing import Any, Callable, Dict, Optional
+
+from slot_analyzer.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+class ServiceRegistry:
+    """Holds one shared instance per named service."""
+
+    def __init__(self):
+        self.services: Dict[str, Any] = {}
+
+    def register(self, name: str, service: Any) -> None:
+        """Register a service instance under a name."""
+        self.services[name] = service
+
+    def get(self, name: str) -> Optional[Any]:
+        """Get a registered service, or None if it is not registered."""
+        return self.services.get(name)
+
+    def get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Get a registered service, creating and registering it on first use."""
+        service = self.services.get(name)
+        if service is None:
+            service = factory()
+            self.services[name] = service
+        return service
+
+    def cleanup(self) -> None:
+        """Close every registered service that supports it and clear the registry."""
+        for name, service in self.services.items():
+            close = getattr(service, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.error("Error closing service", service=name, error=str(e))
+        self.services.clear()
+
+# Shared registry for the running process
+registry = ServiceRegistry()
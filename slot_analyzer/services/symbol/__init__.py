@@ -1,7 +1,12 @@
 """
 Symbol recognition service for slot game analysis.
 """
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from typing import Optional, List, Tuple
 
 from loguru import logger
@@ -11,12 +16,42 @@ from ...config import get_settings
 from ...config.layouts import GameLayout, GridPosition
 from .recognizer import SymbolRecognizer
 
+# Acknowledge processed messages in batches of this size, or after this
+# long without a flush, instead of one broker round-trip per message
+ACK_BATCH_SIZE = 64
+ACK_FLUSH_MS = 200
+
+# Recognizer owned by each worker process, built once by _init_worker
+_worker_recognizer: Optional[SymbolRecognizer] = None
+
+def _init_worker(layout: GameLayout):
+    """Create the recognizer for a worker process"""
+    global _worker_recognizer
+    _worker_recognizer = SymbolRecognizer(layout)
+
+def _worker_extract(screenshot_path: str) -> List[Tuple[str, GridPosition, float]]:
+    """Extract symbols from a screenshot inside a worker process"""
+    return _worker_recognizer.extract_symbols(Path(screenshot_path))
+
 class SymbolRecognitionService:
     """Service for managing symbol recognition and queue integration"""
     
     def __init__(self, layout: GameLayout):
         """Initialize symbol recognition service"""
+        # Built here first so the template cache exists before workers start
         self.recognizer = SymbolRecognizer(layout)
+        # Recognition is CPU-bound, so frames are matched in parallel processes
+        self._pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(layout,)
+        )
+        # Finished work, handed back to the consuming thread for acking
+        self._completed: SimpleQueue = SimpleQueue()
+        self._in_flight = 0
+        self._pending_acks: List[Message] = []
+        self._last_ack_flush = 0.0
+        self._multiple_acks = False
         self._setup_queue()
         
     def _setup_queue(self):
@@ -27,35 +62,96 @@ class SymbolRecognitionService:
         
     def start(self):
         """Start consuming screenshot messages"""
-        with Consumer(self.connection, queues=[self.queue], callbacks=[self._process_screenshot]):
+        # Only AMQP brokers honour cumulative acks; virtual transports such
+        # as Redis ignore multiple=True and ack just the one message
+        self._multiple_acks = self.connection.transport.driver_type == "amqp"
+        flush_interval = ACK_FLUSH_MS / 1000
+        with Consumer(
+            self.connection,
+            queues=[self.queue],
+            callbacks=[self._process_screenshot],
+            prefetch_count=ACK_BATCH_SIZE
+        ):
             logger.info("Symbol recognition service started")
-            while True:
-                try:
-                    self.connection.drain_events()
-                except KeyboardInterrupt:
-                    break
+            self._last_ack_flush = time.monotonic()
+            try:
+                while True:
+                    try:
+                        self.connection.drain_events(timeout=flush_interval)
+                    except socket.timeout:
+                        pass
+                    except KeyboardInterrupt:
+                        break
+                    self._settle_completed()
+                    if time.monotonic() - self._last_ack_flush >= flush_interval:
+                        self._flush_acks()
+            finally:
+                self._pool.shutdown(wait=True)
+                self._settle_completed()
+                self._flush_acks()
+                
+    def _ack(self, message: Message):
+        """Queue a message for the next batched acknowledgement"""
+        self._pending_acks.append(message)
+        if len(self._pending_acks) >= ACK_BATCH_SIZE:
+            self._flush_acks()
+            
+    def _flush_acks(self):
+        """Acknowledge every pending message"""
+        self._last_ack_flush = time.monotonic()
+        if not self._pending_acks:
+            return
+        # A cumulative ack would also cover earlier messages still in a worker.
+        # Workers finish out of order, so ack up to the highest delivery tag
+        if self._multiple_acks and not self._in_flight:
+            max(self._pending_acks, key=lambda m: m.delivery_tag).ack(multiple=True)
+        else:
+            for message in self._pending_acks:
+                message.ack()
+        self._pending_acks.clear()
                     
     def _process_screenshot(self, body: dict, message: Message):
-        """Process screenshot message from queue"""
+        """Dispatch a screenshot message from the queue to a worker process"""
         try:
             screenshot_path = Path(body["path"])
             if not screenshot_path.exists():
                 logger.error(f"Screenshot not found: {screenshot_path}")
-                message.ack()
+                self._ack(message)
                 return
                 
-            # Extract symbols
-            symbols = self.recognizer.extract_symbols(screenshot_path)
-            
-            # Store results (timestamp from screenshot name for sync)
+            # Timestamp from screenshot name for sync
             timestamp = screenshot_path.stem.split("_")[1]
-            self._store_results(symbols, timestamp)
-            
-            message.ack()
+            future = self._pool.submit(_worker_extract, str(screenshot_path))
             
         except Exception as e:
             logger.error(f"Failed to process screenshot: {str(e)}")
+            # Settle earlier messages first so a cumulative ack never covers this one
+            self._flush_acks()
             message.reject()
+            return
+            
+        # Kombu channels are not thread-safe, so the pool's callback thread
+        # only queues the result; start() acks it on the consuming thread
+        self._in_flight += 1
+        future.add_done_callback(
+            lambda done: self._completed.put((message, timestamp, done))
+        )
+        
+    def _settle_completed(self):
+        """Store results of finished screenshots and acknowledge their messages"""
+        while True:
+            try:
+                message, timestamp, future = self._completed.get_nowait()
+            except Empty:
+                return
+            self._in_flight -= 1
+            try:
+                self._store_results(future.result(), timestamp)
+                self._ack(message)
+            except Exception as e:
+                logger.error(f"Failed to process screenshot: {str(e)}")
+                self._flush_acks()
+                message.reject()
             
     def _store_results(self, symbols: List[Tuple[str, GridPosition, float]], timestamp: str):
         """Store symbol recognition results"""
@@ -1,40 +1,207 @@
 """
 Symbol recognition module for extracting and identifying slot symbols.
 """
+import hashlib
+import os
+import shutil
 import cv2
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
+from ...config import get_settings
 from ...config.layouts import GameLayout, GridPosition, SymbolTemplate
 from ...errors import CaptureError
 
+def _cuda_available() -> bool:
+    """Check whether OpenCV was built with CUDA and can see a device"""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+# Batched scoring runs its matrix product on the GPU when one is usable
+_USE_CUDA = _cuda_available()
+
+# Slack for float32 rounding when skipping templates that cannot win
+_PRUNE_MARGIN = 1e-4
+
 class SymbolRecognizer:
     """Handles symbol recognition and extraction from screenshots"""
 
-    def __init__(self, layout: GameLayout):
+    def __init__(self, layout: GameLayout, downsample: bool = False):
         """
         Initialize symbol recognizer with game layout.
         
         Args:
             layout: Game-specific layout configuration
+            downsample: Match at half resolution (cv2.pyrDown) for speed.
+                Confidences shift slightly, so thresholds may need tuning.
         """
         if not layout.validate():
             raise ValueError("Invalid game layout configuration")
             
         self.layout = layout
+        self.downsample = downsample
         self._symbol_templates: Dict[str, np.ndarray] = {}
+        # Float32 templates fitted to each cell shape (height, width) in the layout
+        self._fitted_templates: Dict[Tuple[int, int], Dict[str, np.ndarray]] = {}
+        # Pairwise angles between the fitted templates of each cell shape,
+        # in layout symbol order, used to skip templates that cannot win
+        self._template_angles: Dict[Tuple[int, int], np.ndarray] = {}
+        # Matches per symbol; templates are tried most frequent first
+        self._hit_counts = np.zeros(0, dtype=np.int64)
+        # Position indices grouped by cell shape (height, width)
+        positions = layout.positions_array
+        shapes = positions[:, [5, 4]]
+        self._shape_groups: Dict[Tuple[int, int], np.ndarray] = {
+            tuple(shape): np.flatnonzero((shapes == shape).all(axis=1))
+            for shape in np.unique(shapes, axis=0).tolist()
+        }
+        # Batched matching state, built by _prepare_batch when every grid
+        # position has the same size
+        self._cell_size: Optional[Tuple[int, int]] = None
+        self._template_matrix: Optional[np.ndarray] = None
+        self._template_norms: Optional[np.ndarray] = None
+        self._thresholds: Optional[np.ndarray] = None
+        self._gpu_templates_t = None
         self._load_templates()
+        self._fit_templates()
+        self._prepare_batch()
         
     def _load_templates(self):
-        """Load and cache symbol templates"""
+        """
+        Load and cache symbol templates.
+        
+        Grayscale templates are saved once as .npy files and memory-mapped
+        on later starts, so restarts and worker processes skip PNG decoding
+        and share the pages through the OS page cache.
+        """
+        cache_dir = self._template_cache_dir()
+        if cache_dir is not None and cache_dir.is_dir():
+            try:
+                self._symbol_templates = {
+                    symbol.name: np.load(cache_dir / f"{index}.npy", mmap_mode="r")
+                    for index, symbol in enumerate(self.layout.symbols)
+                }
+                return
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable template cache {cache_dir}: {e}")
+
         for symbol in self.layout.symbols:
             template_path = self.layout.template_dir / symbol.template_path
             template = cv2.imread(str(template_path))
             if template is None:
                 raise ValueError(f"Failed to load template: {template_path}")
             self._symbol_templates[symbol.name] = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+
+        if cache_dir is not None:
+            self._save_template_cache(cache_dir)
+
+    def _template_cache_dir(self) -> Optional[Path]:
+        """Cache location keyed by the layout's template files, or None if one is missing"""
+        digest = hashlib.blake2b(self.layout.name.encode(), digest_size=8)
+        try:
+            for symbol in self.layout.symbols:
+                stat = (self.layout.template_dir / symbol.template_path).stat()
+                digest.update(
+                    f"\0{symbol.name}\0{symbol.template_path}\0{stat.st_mtime_ns}\0{stat.st_size}".encode()
+                )
+        except OSError:
+            return None
+        settings = get_settings()
+        return settings.BASE_DIR / settings.CACHE_DIR / f"templates_{digest.hexdigest()}"
+
+    def _save_template_cache(self, cache_dir: Path):
+        """Write templates to a temporary directory and move it into place"""
+        tmp_dir = cache_dir.with_name(f"{cache_dir.name}.{os.getpid()}.tmp")
+        try:
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            for index, symbol in enumerate(self.layout.symbols):
+                np.save(tmp_dir / f"{index}.npy", self._symbol_templates[symbol.name])
+            os.replace(tmp_dir, cache_dir)
+        except OSError as e:
+            # Another process may have written the cache first
+            logger.debug(f"Template cache not written to {cache_dir}: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _fit_template(self, template: np.ndarray, height: int, width: int) -> np.ndarray:
+        """Resize a template to a cell shape and convert it for matching"""
+        if template.shape != (height, width):
+            template = cv2.resize(template, (width, height))
+        if self.downsample:
+            template = cv2.pyrDown(template)
+        return template.astype(np.float32)
+
+    def _fit_templates(self):
+        """Resize every template once per distinct cell shape in the layout"""
+        shapes = {(pos.height, pos.width) for pos in self.layout.positions}
+        self._fitted_templates = {
+            (height, width): {
+                name: self._fit_template(template, height, width)
+                for name, template in self._symbol_templates.items()
+            }
+            for height, width in shapes
+        }
+        self._template_angles = {
+            shape: self._pairwise_angles(fitted)
+            for shape, fitted in self._fitted_templates.items()
+        }
+        hit_counts = np.zeros(len(self.layout.symbols), dtype=np.int64)
+        hit_counts[:self._hit_counts.size] = self._hit_counts
+        self._hit_counts = hit_counts
+
+    def _pairwise_angles(self, fitted: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Angles between mean-centered templates, in layout symbol order.
+        
+        TM_CCOEFF_NORMED between equal-sized images is the cosine of this
+        angle, so the angles obey the triangle inequality.
+        """
+        if not self.layout.symbols:
+            return np.zeros((0, 0))
+        vectors = np.stack([fitted[symbol.name].reshape(-1) for symbol in self.layout.symbols])
+        vectors = vectors.astype(np.float64)
+        vectors -= vectors.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(vectors, axis=1)
+        # Flat templates have no direction; a zero angle never prunes
+        norms[norms == 0] = np.inf
+        vectors /= norms[:, None]
+        angles = np.arccos(np.clip(vectors @ vectors.T, -1.0, 1.0))
+        angles[:, norms == np.inf] = 0.0
+        angles[norms == np.inf, :] = 0.0
+        return angles
+
+    def _prepare_batch(self):
+        """
+        Pre-resize templates to the grid cell size and pack them for batched matching.
+        
+        Each template is resized to the cell size, flattened, and centered
+        on its mean, so that scoring every position against every symbol
+        is a single matrix product. Layouts with mixed cell sizes keep the
+        per-position matching path.
+        """
+        sizes = {(pos.width, pos.height) for pos in self.layout.positions}
+        if len(sizes) != 1 or not self.layout.symbols:
+            self._cell_size = None
+            self._template_matrix = None
+            return
+
+        width, height = self._cell_size = sizes.pop()
+        fitted = self._fitted_templates[(height, width)]
+        matrix = np.stack([fitted[symbol.name].reshape(-1) for symbol in self.layout.symbols])
+        matrix -= matrix.mean(axis=1, keepdims=True)
+        self._template_matrix = matrix
+        if _USE_CUDA:
+            # Upload the transposed templates once; frames only upload cells
+            self._gpu_templates_t = cv2.cuda_GpuMat()
+            self._gpu_templates_t.upload(np.ascontiguousarray(matrix.T))
+        self._template_norms = np.linalg.norm(matrix, axis=1)
+        self._thresholds = np.array(
+            [symbol.confidence_threshold for symbol in self.layout.symbols],
+            dtype=np.float32
+        )
             
     def extract_symbols(self, screenshot_path: Path) -> List[Tuple[str, GridPosition, float]]:
         """
@@ -56,17 +223,20 @@ class SymbolRecognizer:
                 raise CaptureError(f"Failed to load screenshot: {screenshot_path}")
                 
             gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+            if self._template_matrix is not None:
+                return self._match_batch(gray)
+
             results = []
+            match_order = np.argsort(-self._hit_counts, kind="stable")
             
             # Process each grid position
-            for position in self.layout.positions:
-                # Extract region of interest
-                roi = self._extract_roi(gray, position)
+            rois = self._gather_rois(gray)
+            for position, roi in zip(self.layout.positions, rois):
                 if roi is None:
                     continue
                     
                 # Find best matching symbol
-                symbol_match = self._match_symbol(roi)
+                symbol_match = self._match_symbol(roi, match_order)
                 if symbol_match:
                     symbol_name, confidence = symbol_match
                     results.append((symbol_name, position, confidence))
@@ -77,6 +247,95 @@ class SymbolRecognizer:
             logger.error(f"Symbol extraction failed: {str(e)}")
             raise CaptureError(f"Symbol extraction failed: {str(e)}")
             
+    def _match_batch(self, gray: np.ndarray) -> List[Tuple[str, GridPosition, float]]:
+        """
+        Score every grid position against every symbol in one pass.
+        
+        For a template the same size as the region, TM_CCOEFF_NORMED is
+        the correlation of the two mean-centered pixel vectors, so all
+        scores come from one (positions x symbols) matrix product.
+        """
+        width, height = self._cell_size
+        positions = self.layout.positions_array
+        xs, ys = positions[:, 2], positions[:, 3]
+
+        symbols = self.layout.symbols
+        all_positions = self.layout.positions
+        matches: List[Tuple[int, Tuple[str, GridPosition, float]]] = []
+
+        # Cells clipped by the frame edge are matched on their clipped
+        # region, one at a time, the way the per-position path does
+        inside = (xs + width <= gray.shape[1]) & (ys + height <= gray.shape[0])
+        if not inside.all():
+            match_order = np.argsort(-self._hit_counts, kind="stable")
+            for position_index in np.flatnonzero(~inside):
+                position = all_positions[position_index]
+                roi = self._extract_roi(gray, position)
+                if roi is None or roi.size == 0:
+                    continue
+                symbol_match = self._match_symbol(roi, match_order)
+                if symbol_match:
+                    symbol_name, confidence = symbol_match
+                    matches.append((position_index, (symbol_name, position, float(confidence))))
+
+        indices = np.flatnonzero(inside)
+        if indices.size:
+            # Gather every cell as a view of the frame, then copy once
+            windows = np.lib.stride_tricks.sliding_window_view(gray, (height, width))
+            cells = windows[ys[indices], xs[indices]]
+            if self.downsample:
+                # Reduce each cell on its own so results match _match_symbol
+                cells = np.stack([cv2.pyrDown(cell) for cell in cells])
+            rois = cells.reshape(indices.size, -1).astype(np.float32)
+            rois -= rois.mean(axis=1, keepdims=True)
+
+            denom = np.linalg.norm(rois, axis=1)[:, None] * self._template_norms[None, :]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(denom > 0, self._correlate(rois) / denom, 0.0)
+
+            # A symbol only counts when it beats both its threshold and zero
+            scores = np.where((scores > self._thresholds) & (scores > 0), scores, -np.inf)
+            best = scores.argmax(axis=1)
+            confidences = scores[np.arange(indices.size), best]
+            matches.extend(
+                (position_index, (symbols[symbol_index].name, all_positions[position_index], float(confidence)))
+                for position_index, symbol_index, confidence in zip(indices, best, confidences)
+                if confidence != -np.inf
+            )
+
+        # Report in layout order, as the per-position path does
+        matches.sort(key=lambda match: match[0])
+        return [match for _, match in matches]
+
+    def _correlate(self, rois: np.ndarray) -> np.ndarray:
+        """Multiply centered cells by the centered templates, on the GPU if available"""
+        if self._gpu_templates_t is None:
+            return rois @ self._template_matrix.T
+
+        gpu_rois = cv2.cuda_GpuMat()
+        gpu_rois.upload(rois)
+        product = cv2.cuda.gemm(gpu_rois, self._gpu_templates_t, 1.0, cv2.cuda_GpuMat(), 0.0)
+        return product.download()
+
+    def _gather_rois(self, gray: np.ndarray) -> List[Optional[np.ndarray]]:
+        """Extract the region of interest of every grid position, in layout order
+        
+        Cells of each shape are gathered from the frame in one indexing
+        operation; only cells clipped by the frame edge are sliced singly.
+        """
+        positions = self.layout.positions_array
+        rois: List[Optional[np.ndarray]] = [None] * len(positions)
+        for (height, width), indices in self._shape_groups.items():
+            xs, ys = positions[indices, 2], positions[indices, 3]
+            inside = (xs + width <= gray.shape[1]) & (ys + height <= gray.shape[0])
+            if inside.any():
+                windows = np.lib.stride_tricks.sliding_window_view(gray, (height, width))
+                for index, roi in zip(indices[inside], windows[ys[inside], xs[inside]]):
+                    rois[index] = roi
+            for index in indices[~inside]:
+                rois[index] = self._extract_roi(gray, self.layout.positions[index])
+        return rois
+
     def _extract_roi(self, screenshot: np.ndarray, position: GridPosition) -> Optional[np.ndarray]:
         """Extract region of interest for a grid position"""
         try:
@@ -88,32 +347,59 @@ class SymbolRecognizer:
             logger.warning(f"Invalid ROI coordinates for position: {position}")
             return None
             
-    def _match_symbol(self, roi: np.ndarray) -> Optional[Tuple[str, float]]:
+    def _match_symbol(self, roi: np.ndarray, match_order: np.ndarray) -> Optional[Tuple[str, float]]:
         """
         Find best matching symbol template for region of interest.
         
+        Templates are tried in ``match_order``. The score of the closest
+        template so far bounds every other template's score through the
+        angles between templates, and templates whose bound cannot beat
+        the current best (or their own threshold) are skipped.
+        
         Returns:
             Tuple of (symbol_name, confidence) or None if no match
         """
-        best_match = None
+        best_index = None
         best_confidence = 0
         
-        for symbol in self.layout.symbols:
-            template = self._symbol_templates[symbol.name]
-            
-            # Resize template to match ROI size if needed
-            if template.shape != roi.shape:
-                template = cv2.resize(template, (roi.shape[1], roi.shape[0]))
+        # Cells clipped by the screenshot edge need their own fitted templates
+        fitted = self._fitted_templates.get(roi.shape)
+        angles = self._template_angles.get(roi.shape)
+        if fitted is None:
+            fitted = {
+                name: self._fit_template(template, *roi.shape)
+                for name, template in self._symbol_templates.items()
+            }
+            angles = self._pairwise_angles(fitted)
+        roi = cv2.pyrDown(roi) if self.downsample else roi
+        roi = roi.astype(np.float32)
+
+        symbols = self.layout.symbols
+        anchor = None
+        anchor_angle = 0.0
+        for index in match_order:
+            symbol = symbols[index]
+            if anchor is not None:
+                bound = np.cos(abs(angles[anchor, index] - anchor_angle))
+                if bound + _PRUNE_MARGIN <= max(best_confidence, symbol.confidence_threshold):
+                    continue
                 
             # Perform template matching
-            result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+            result = cv2.matchTemplate(roi, fitted[symbol.name], cv2.TM_CCOEFF_NORMED)
             confidence = result.max()
             
+            angle = np.arccos(np.clip(confidence, -1.0, 1.0))
+            if anchor is None or angle < anchor_angle:
+                anchor, anchor_angle = index, angle
+            
             if confidence > symbol.confidence_threshold and confidence > best_confidence:
-                best_match = symbol.name
+                best_index = index
                 best_confidence = confidence
                 
-        return (best_match, best_confidence) if best_match else None
+        if best_index is None:
+            return None
+        self._hit_counts[best_index] += 1
+        return symbols[best_index].name, best_confidence
         
     def train_symbol(self, symbol_name: str, template_image: Path, confidence_threshold: float = 0.8):
         """
@@ -138,4 +424,6 @@ class SymbolRecognizer:
             name=symbol_name,
             template_path=template_path,
             confidence_threshold=confidence_threshold
-        ))
\ No newline at end of file
+        ))
+        self._fit_templates()
+        self._prepare_batch()
\ No newline at end of file
@@ -6,10 +6,47 @@ except ImportError:
     raise
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
+
+# Font used for the icon text when it is present
+HACK_FONT = Path(__file__).parent / "hack_font.ttf"
+
+@lru_cache(maxsize=8)
+def _load_font(path: Optional[str], size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font, or Pillow's default font when path is None."""
+    if path is not None:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default().font_variant(size=size)
+
+@lru_cache(maxsize=8)
+def _text_extent(path: Optional[str], size: int, text: str) -> Tuple[int, int]:
+    """Right and bottom edge of text drawn at the origin with a cached font."""
+    return _load_font(path, size).getbbox(text)[2:4]
+
+def _icon_up_to_date(assets_dir: Path, font_path: Optional[Path]) -> bool:
+    """Check whether both icon files are newer than everything they are drawn from."""
+    outputs = [assets_dir / "icon.png", assets_dir / "icon.ico"]
+    if not all(output.exists() for output in outputs):
+        return False
+    sources = [Path(__file__)]
+    if font_path is not None and font_path.exists():
+        sources.append(font_path)
+    newest_source = max(source.stat().st_mtime for source in sources)
+    return min(output.stat().st_mtime for output in outputs) >= newest_source
+
+def create_icon(font_path: Optional[Path] = HACK_FONT):
+    """Create a simple hacker-style icon.
+    
+    Args:
+        font_path: TrueType font for the icon text; Pillow's default font
+            is used when it is None or missing
+    """
+    assets_dir = Path(__file__).parent
+    if _icon_up_to_date(assets_dir, font_path):
+        return
 
-def create_icon():
-    """Create a simple hacker-style icon."""
     # Create a new image with a black background
     img_size = 256
     img = Image.new('RGBA', (img_size, img_size), (0, 0, 0, 0))
@@ -26,26 +63,20 @@ def create_icon():
 
     # Draw a simple slot machine symbol
     try:
-        # Try to use a custom font if available
-        font_path = Path(__file__).parent / "hack_font.ttf"
-        if font_path.exists():
-            font = ImageFont.truetype(str(font_path), 120)
-        else:
-            # Fall back to default font
-            font = ImageFont.load_default().font_variant(size=120)
+        # Try to use a custom font if available, else the default font
+        path = str(font_path) if font_path is not None and font_path.exists() else None
 
         # Draw text
         text = "S"
-        text_width, text_height = draw.textsize(text, font=font)
+        text_width, text_height = _text_extent(path, 120, text)
         position = ((img_size - text_width) // 2, (img_size - text_height) // 2 - 10)
-        draw.text(position, text, fill=(0, 255, 65, 255), font=font)
+        draw.text(position, text, fill=(0, 255, 65, 255), font=_load_font(path, 120))
 
         # Draw binary-like pattern at the bottom
         binary = "10101010"
-        binary_font = ImageFont.load_default().font_variant(size=20)
-        binary_width, binary_height = draw.textsize(binary, font=binary_font)
+        binary_width, binary_height = _text_extent(None, 20, binary)
         binary_position = ((img_size - binary_width) // 2, img_size - binary_height - 20)
-        draw.text(binary_position, binary, fill=(0, 255, 65, 255), font=binary_font)
+        draw.text(binary_position, binary, fill=(0, 255, 65, 255), font=_load_font(None, 20))
 
     except Exception as e:
         # Draw a simple symbol if text fails
@@ -58,12 +89,20 @@ def create_icon():
         )
 
     # Save the image as PNG and ICO
-    assets_dir = Path(__file__).parent
-    img.save(assets_dir / "icon.png")
+    # zlib level 1: compression ratio doesn't matter for a build-time icon
+    img.save(assets_dir / "icon.png", compress_level=1)
 
-    # Convert to ICO format
+    # Convert to ICO format; the smaller entries are scaled once here and stored
+    # as BMP, so Pillow neither re-resamples nor PNG-encodes each size
+    sizes = [(32, 32), (64, 64), (128, 128), (256, 256)]
     try:
-        img.save(assets_dir / "icon.ico", format="ICO", sizes=[(32, 32), (64, 64), (128, 128), (256, 256)])
+        img.save(
+            assets_dir / "icon.ico",
+            format="ICO",
+            sizes=sizes,
+            append_images=[img.resize(size, Image.Resampling.BILINEAR) for size in sizes[:-1]],
+            bitmap_format="bmp"
+        )
     except Exception as e:
         # Save as PNG only if ICO fails
         pass
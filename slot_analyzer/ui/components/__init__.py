@@ -1,22 +1,31 @@
-"""UI components for the slot analyzer application."""
+"""UI components for the slot analyzer application.
 
-from .capture_monitor import CaptureMonitor
-from .symbol_grid import SymbolGrid
-from .pattern_viewer import PatternViewer
-from .session_controls import SessionControls
-from .data_viewer import DataViewer
-from .session_manager import SessionManager
-from .config_editor import ConfigEditor
-from .matrix_effect import MatrixEffect, MatrixBackground
+Components are imported on first access, so importing one does not pull
+in the dependencies of the others (such as Pillow for the capture monitor).
+"""
 
-__all__ = [
-    'CaptureMonitor',
-    'SymbolGrid',
-    'PatternViewer',
-    'SessionControls',
-    'DataViewer',
-    'SessionManager',
-    'ConfigEditor',
-    'MatrixEffect',
-    'MatrixBackground'
-]
\ No newline at end of file
+from importlib import import_module
+
+# Public component name -> submodule that defines it
+_COMPONENTS = {
+    'CaptureMonitor': 'capture_monitor',
+    'SymbolGrid': 'symbol_grid',
+    'PatternViewer': 'pattern_viewer',
+    'SessionControls': 'session_controls',
+    'DataViewer': 'data_viewer',
+    'SessionManager': 'session_manager',
+    'ConfigEditor': 'config_editor',
+    'MatrixEffect': 'matrix_effect',
+    'MatrixBackground': 'matrix_effect'
+}
+
+__all__ = list(_COMPONENTS)
+
+def __getattr__(name: str):
+    """Import a component's submodule on first access."""
+    module = _COMPONENTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -3,8 +3,10 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from PIL import Image, ImageTk
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,10 @@ class CaptureMonitor(ttk.Frame):
         self.screenshot_label: Optional[ttk.Label] = None
         self.status_var = tk.StringVar(value="Waiting for capture...")
         
+        # Displayed Tk photo, reused while the preview size stays the same
+        self._photo: Optional["ImageTk.PhotoImage"] = None
+        self._photo_size = (0, 0)
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -72,18 +78,8 @@ class CaptureMonitor(ttk.Frame):
             
             # Update screenshot if available
             screenshot = data.get("screenshot")
-            if screenshot and isinstance(screenshot, Image.Image):
-                # Resize image to fit display while maintaining aspect ratio
-                display_size = (400, 300)  # Maximum display size
-                screenshot.thumbnail(display_size, Image.Resampling.LANCZOS)
-                
-                # Convert to PhotoImage for display
-                photo = ImageTk.PhotoImage(screenshot)
-                
-                # Update or create screenshot label
-                if self.screenshot_label:
-                    self.screenshot_label.configure(image=photo, text="")
-                    self.screenshot_label.image = photo  # Keep reference to prevent garbage collection
+            if screenshot:
+                self._show_screenshot(screenshot)
             
             # Update capture details
             if "request_count" in data:
@@ -97,10 +93,40 @@ class CaptureMonitor(ttk.Frame):
             logger.error(f"Error updating capture monitor display: {e}")
             self.status_var.set("Error updating display")
 
+    def _show_screenshot(self, screenshot: Any):
+        """Show a screenshot, scaled down to fit the display.
+        
+        Args:
+            screenshot: PIL image to display; other values are ignored
+        """
+        # Pillow and its Tk bindings are only loaded once there is a
+        # screenshot to show
+        from PIL import Image, ImageTk
+        if not isinstance(screenshot, Image.Image):
+            return
+            
+        # Resize a copy to fit the display while maintaining aspect ratio;
+        # the caller's image is left untouched
+        display_size = (400, 300)  # Maximum display size
+        if screenshot.width > display_size[0] or screenshot.height > display_size[1]:
+            screenshot = screenshot.copy()
+            screenshot.thumbnail(display_size, Image.Resampling.BILINEAR)
+        
+        # Paste into the existing Tk photo when the size is unchanged,
+        # rather than creating and uploading a new one each frame
+        if self._photo is not None and self._photo_size == screenshot.size:
+            self._photo.paste(screenshot)
+        else:
+            self._photo = ImageTk.PhotoImage(screenshot)
+            self._photo_size = screenshot.size
+            if self.screenshot_label:
+                self.screenshot_label.configure(image=self._photo, text="")
+
     def clear_display(self):
         """Clear the display and reset to initial state."""
         self.status_var.set("Waiting for capture...")
         if self.screenshot_label:
             self.screenshot_label.configure(image="", text="No screenshot available")
+        self._photo = None
         self.request_count.set("0")
         self.last_capture.set("N/A")
\ No newline at end of file
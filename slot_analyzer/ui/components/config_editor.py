@@ -3,11 +3,75 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Dict, Any, Optional
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, Tuple
 import json
 
 logger = logging.getLogger(__name__)
 
+CONFIG_PATH = "config.json"
+
+# Last parsed config.json, keyed by its modification time and size, so
+# editors and Reset clicks only re-read the file after it changes
+_CONFIG_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+# Editors read and write the cache from their I/O worker threads
+_CONFIG_LOCK = threading.Lock()
+
+def _file_key(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def _read_config_cached(path: str = CONFIG_PATH) -> Optional[Dict[str, Any]]:
+    """Read config.json, reusing the last parse while the file is unchanged.
+    
+    Returns:
+        A copy of the configuration, or None if the file does not exist
+    """
+    global _CONFIG_CACHE
+    with _CONFIG_LOCK:
+        try:
+            key = _file_key(path)
+        except FileNotFoundError:
+            return None
+        if _CONFIG_CACHE is None or _CONFIG_CACHE[0] != key:
+            with open(path, "r") as f:
+                _CONFIG_CACHE = (key, json.load(f))
+        return dict(_CONFIG_CACHE[1])
+
+def _cache_written_config(config: Dict[str, Any], path: str = CONFIG_PATH) -> None:
+    """Remember a configuration just written, so it is not parsed back."""
+    global _CONFIG_CACHE
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE = (_file_key(path), dict(config))
+
+# Numeric settings as (key, label, default, caster, (min, max), tab,
+# validation error); None leaves that end of the range open
+FIELDS = [
+    ("proxy_port", "Proxy Port:", "8080", int, (1, 65535), "Capture",
+     "Port number must be between 1 and 65535"),
+    ("screenshot_interval", "Screenshot Interval (ms):", "1000", int, (100, None), "Capture",
+     "Screenshot interval must be at least 100ms"),
+    ("confidence_threshold", "Confidence Threshold:", "0.8", float, (0, 1), "Symbol Recognition",
+     "Confidence threshold must be between 0 and 1"),
+    ("grid_rows", "Grid Rows:", "3", int, (1, None), "Symbol Recognition",
+     "Grid dimensions must be positive"),
+    ("grid_cols", "Grid Columns:", "5", int, (1, None), "Symbol Recognition",
+     "Grid dimensions must be positive"),
+    ("min_sequence_length", "Min Sequence Length:", "3", int, (2, None), "Pattern Analysis",
+     "Minimum sequence length must be at least 2"),
+]
+
+# Pattern type toggles as (key, checkbox text, default)
+PATTERN_FLAGS = [
+    ("simple_patterns", "Simple", True),
+    ("complex_patterns", "Complex", True),
+    ("custom_patterns", "Custom", False),
+]
+PATTERN_FLAGS_TAB = "Pattern Analysis"
+
 class ConfigEditor(ttk.Frame):
     """Component for editing analyzer configuration settings."""
     
@@ -20,7 +84,10 @@ class ConfigEditor(ttk.Frame):
         super().__init__(parent)
         
         self.current_config: Optional[Dict[str, Any]] = None
-        self.modified = False
+        self._saving = False
+        # config.json is read and written on this worker; results are
+        # polled from the Tk thread, which is the only one touching widgets
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         
         self._init_ui()
         self._load_config()
@@ -36,223 +103,177 @@ class ConfigEditor(ttk.Frame):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill="both", expand=True, padx=5, pady=5)
         
-        # Capture settings tab
-        self.capture_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.capture_frame, text="Capture")
-        
-        capture_grid = ttk.Frame(self.capture_frame)
-        capture_grid.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Port number
-        ttk.Label(capture_grid, text="Proxy Port:").grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.port_var = tk.StringVar(value="8080")
-        ttk.Entry(
-            capture_grid,
-            textvariable=self.port_var,
-            width=10
-        ).grid(row=0, column=1, sticky="w")
-        
-        # Screenshot interval
-        ttk.Label(capture_grid, text="Screenshot Interval (ms):").grid(row=1, column=0, sticky="w", padx=(0, 5))
-        self.interval_var = tk.StringVar(value="1000")
-        ttk.Entry(
-            capture_grid,
-            textvariable=self.interval_var,
-            width=10
-        ).grid(row=1, column=1, sticky="w")
-        
-        # Symbol recognition settings tab
-        self.symbol_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.symbol_frame, text="Symbol Recognition")
-        
-        symbol_grid = ttk.Frame(self.symbol_frame)
-        symbol_grid.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Confidence threshold
-        ttk.Label(symbol_grid, text="Confidence Threshold:").grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.confidence_var = tk.StringVar(value="0.8")
-        ttk.Entry(
-            symbol_grid,
-            textvariable=self.confidence_var,
-            width=10
-        ).grid(row=0, column=1, sticky="w")
+        # One tab per distinct tab name, in the order the fields list them
+        self.tabs: Dict[str, ttk.Frame] = {}
+        for tab in dict.fromkeys(field[5] for field in FIELDS):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=tab)
+            grid = ttk.Frame(frame)
+            grid.pack(fill="both", expand=True, padx=5, pady=5)
+            self.tabs[tab] = grid
         
-        # Grid dimensions
-        ttk.Label(symbol_grid, text="Grid Dimensions:").grid(row=1, column=0, sticky="w", padx=(0, 5))
-        grid_frame = ttk.Frame(symbol_grid)
-        grid_frame.grid(row=1, column=1, sticky="w")
-        
-        self.rows_var = tk.StringVar(value="3")
-        ttk.Entry(
-            grid_frame,
-            textvariable=self.rows_var,
-            width=5
-        ).pack(side="left", padx=(0, 5))
-        
-        ttk.Label(grid_frame, text="x").pack(side="left", padx=5)
-        
-        self.cols_var = tk.StringVar(value="5")
-        ttk.Entry(
-            grid_frame,
-            textvariable=self.cols_var,
-            width=5
-        ).pack(side="left", padx=(5, 0))
-        
-        # Pattern analysis settings tab
-        self.pattern_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.pattern_frame, text="Pattern Analysis")
-        
-        pattern_grid = ttk.Frame(self.pattern_frame)
-        pattern_grid.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Minimum sequence length
-        ttk.Label(pattern_grid, text="Min Sequence Length:").grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.min_seq_var = tk.StringVar(value="3")
-        ttk.Entry(
-            pattern_grid,
-            textvariable=self.min_seq_var,
-            width=10
-        ).grid(row=0, column=1, sticky="w")
+        # Numeric fields, one label/entry row each
+        self.vars: Dict[str, tk.Variable] = {}
+        for name, label, default, _, _, tab, _ in FIELDS:
+            grid = self.tabs[tab]
+            row = grid.grid_size()[1]
+            ttk.Label(grid, text=label).grid(row=row, column=0, sticky="w", padx=(0, 5))
+            self.vars[name] = tk.StringVar(value=default)
+            ttk.Entry(grid, textvariable=self.vars[name], width=10).grid(row=row, column=1, sticky="w")
         
         # Pattern types
-        ttk.Label(pattern_grid, text="Pattern Types:").grid(row=1, column=0, sticky="w", padx=(0, 5))
-        pattern_frame = ttk.Frame(pattern_grid)
-        pattern_frame.grid(row=1, column=1, sticky="w")
-        
-        self.simple_patterns = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            pattern_frame,
-            text="Simple",
-            variable=self.simple_patterns
-        ).pack(side="left", padx=(0, 5))
-        
-        self.complex_patterns = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            pattern_frame,
-            text="Complex",
-            variable=self.complex_patterns
-        ).pack(side="left", padx=(0, 5))
-        
-        self.custom_patterns = tk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            pattern_frame,
-            text="Custom",
-            variable=self.custom_patterns
-        ).pack(side="left")
+        grid = self.tabs[PATTERN_FLAGS_TAB]
+        row = grid.grid_size()[1]
+        ttk.Label(grid, text="Pattern Types:").grid(row=row, column=0, sticky="w", padx=(0, 5))
+        flags_frame = ttk.Frame(grid)
+        flags_frame.grid(row=row, column=1, sticky="w")
+        for name, text, default in PATTERN_FLAGS:
+            self.vars[name] = tk.BooleanVar(value=default)
+            ttk.Checkbutton(flags_frame, text=text, variable=self.vars[name]).pack(side="left", padx=(0, 5))
         
         # Action buttons
         button_frame = ttk.Frame(self)
         button_frame.pack(fill="x", padx=5, pady=5)
         
-        ttk.Button(
+        self.save_button = ttk.Button(
             button_frame,
             text="Save",
             command=self._save_config
-        ).pack(side="left", padx=(0, 5))
+        )
+        self.save_button.pack(side="left", padx=(0, 5))
         
         ttk.Button(
             button_frame,
             text="Reset",
             command=self._load_config
         ).pack(side="left")
+    
+    def is_modified(self) -> bool:
+        """Check whether the edited values differ from the saved configuration.
         
-        # Bind change events
-        self._bind_change_events()
+        Compared on demand rather than tracked with variable traces, so
+        typing in a field does not call back into Python per keystroke.
+        """
+        try:
+            return self._current_values() != self.current_config
+        except ValueError:
+            # Values that don't parse cannot match the saved configuration
+            return True
     
-    def _bind_change_events(self):
-        """Bind events for detecting configuration changes."""
-        self.port_var.trace_add("write", self._on_change)
-        self.interval_var.trace_add("write", self._on_change)
-        self.confidence_var.trace_add("write", self._on_change)
-        self.rows_var.trace_add("write", self._on_change)
-        self.cols_var.trace_add("write", self._on_change)
-        self.min_seq_var.trace_add("write", self._on_change)
-        self.simple_patterns.trace_add("write", self._on_change)
-        self.complex_patterns.trace_add("write", self._on_change)
-        self.custom_patterns.trace_add("write", self._on_change)
+    def _load_config(self):
+        """Load configuration from file in a worker thread."""
+        self._run_io(_read_config_cached, self._on_load_done, self._on_load_error)
     
-    def _on_change(self, *args):
-        """Handle configuration value changes."""
-        self.modified = True
+    def _run_io(self, work: Callable, on_done: Callable, on_error: Callable, *args):
+        """Run file I/O on the worker and report its outcome on the Tk thread."""
+        future = self._io_pool.submit(work, *args)
+        self.after(10, self._poll_io, future, on_done, on_error)
     
-    def _load_config(self):
-        """Load configuration from file."""
+    def _poll_io(self, future: Future, on_done: Callable, on_error: Callable):
+        """Hand a finished I/O result to its callback, or check again later."""
+        if not future.done():
+            self.after(10, self._poll_io, future, on_done, on_error)
+            return
         try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-                
-            # Update UI with loaded values
-            self.port_var.set(str(config.get("proxy_port", 8080)))
-            self.interval_var.set(str(config.get("screenshot_interval", 1000)))
-            self.confidence_var.set(str(config.get("confidence_threshold", 0.8)))
-            self.rows_var.set(str(config.get("grid_rows", 3)))
-            self.cols_var.set(str(config.get("grid_cols", 5)))
-            self.min_seq_var.set(str(config.get("min_sequence_length", 3)))
-            self.simple_patterns.set(config.get("simple_patterns", True))
-            self.complex_patterns.set(config.get("complex_patterns", True))
-            self.custom_patterns.set(config.get("custom_patterns", False))
-            
-            self.current_config = config
-            self.modified = False
-            
-            logger.info("Configuration loaded successfully")
-            
-        except FileNotFoundError:
+            result = future.result()
+        except Exception as e:
+            on_error(str(e))
+        else:
+            on_done(result)
+    
+    def _on_load_done(self, config: Optional[Dict[str, Any]]):
+        """Show a configuration read by the I/O worker."""
+        if config is None:
             logger.info("No configuration file found, using defaults")
+            self.current_config = None  # Nothing on disk to match
             self._save_config()  # Create default config
+            return
             
-        except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
-            messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
+        # Update UI with loaded values
+        for name, _, default, *_ in FIELDS:
+            self.vars[name].set(str(config.get(name, default)))
+        for name, _, default in PATTERN_FLAGS:
+            self.vars[name].set(config.get(name, default))
+        
+        self.current_config = config
+        
+        logger.info("Configuration loaded successfully")
+    
+    def _on_load_error(self, error: str):
+        """Report a failure to read the configuration."""
+        logger.error(f"Error loading configuration: {error}")
+        messagebox.showerror("Error", f"Failed to load configuration: {error}")
+    
+    def _current_values(self) -> Dict[str, Any]:
+        """Read the configuration values from the UI.
+        
+        Raises:
+            ValueError: If a numeric field does not parse
+        """
+        config = {name: caster(self.vars[name].get()) for name, _, _, caster, *_ in FIELDS}
+        config.update((name, bool(self.vars[name].get())) for name, *_ in PATTERN_FLAGS)
+        return config
     
     def _save_config(self):
-        """Save configuration to file."""
+        """Validate the edited configuration and save it in a worker thread."""
+        if self._saving:
+            return
         try:
-            config = {
-                "proxy_port": int(self.port_var.get()),
-                "screenshot_interval": int(self.interval_var.get()),
-                "confidence_threshold": float(self.confidence_var.get()),
-                "grid_rows": int(self.rows_var.get()),
-                "grid_cols": int(self.cols_var.get()),
-                "min_sequence_length": int(self.min_seq_var.get()),
-                "simple_patterns": bool(self.simple_patterns.get()),
-                "complex_patterns": bool(self.complex_patterns.get()),
-                "custom_patterns": bool(self.custom_patterns.get())
-            }
+            config = self._current_values()
             
             # Validate values
-            if config["proxy_port"] < 1 or config["proxy_port"] > 65535:
-                raise ValueError("Port number must be between 1 and 65535")
-                
-            if config["screenshot_interval"] < 100:
-                raise ValueError("Screenshot interval must be at least 100ms")
-                
-            if config["confidence_threshold"] < 0 or config["confidence_threshold"] > 1:
-                raise ValueError("Confidence threshold must be between 0 and 1")
-                
-            if config["grid_rows"] < 1 or config["grid_cols"] < 1:
-                raise ValueError("Grid dimensions must be positive")
-                
-            if config["min_sequence_length"] < 2:
-                raise ValueError("Minimum sequence length must be at least 2")
-            
-            # Save to file
-            with open("config.json", "w") as f:
-                json.dump(config, f, indent=2)
-            
-            self.current_config = config
-            self.modified = False
-            
-            logger.info("Configuration saved successfully")
-            messagebox.showinfo("Success", "Configuration saved successfully")
+            for name, _, _, _, (lo, hi), _, error in FIELDS:
+                value = config[name]
+                if (lo is not None and value < lo) or (hi is not None and value > hi):
+                    raise ValueError(error)
             
         except ValueError as e:
             logger.error(f"Invalid configuration value: {e}")
             messagebox.showerror("Error", str(e))
-            
-        except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
-            messagebox.showerror("Error", f"Failed to save configuration: {str(e)}")
+            return
+        
+        # Skip the write when nothing changed
+        if config == self.current_config:
+            self._on_save_done(config)
+            return
+        
+        self._saving = True
+        self.save_button.state(["disabled"])
+        self._run_io(self._save_worker, self._on_save_done, self._on_save_error, config)
+    
+    @staticmethod
+    def _save_worker(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Write config.json off the Tk thread.
+        
+        The temporary file and rename mean a failed write never leaves a
+        truncated config.json behind.
+        
+        Returns:
+            The configuration written
+        """
+        tmp_path = Path(f"{CONFIG_PATH}.tmp")
+        tmp_path.write_text(json.dumps(config, indent=2))
+        os.replace(tmp_path, CONFIG_PATH)
+        _cache_written_config(config)
+        return config
+    
+    def _on_save_done(self, config: Dict[str, Any]):
+        """Record a saved configuration and re-enable saving."""
+        self.current_config = config
+        self._end_save()
+        
+        logger.info("Configuration saved successfully")
+        messagebox.showinfo("Success", "Configuration saved successfully")
+    
+    def _on_save_error(self, error: str):
+        """Report a failure to write the configuration and re-enable saving."""
+        self._end_save()
+        logger.error(f"Error saving configuration: {error}")
+        messagebox.showerror("Error", f"Failed to save configuration: {error}")
+    
+    def _end_save(self):
+        self._saving = False
+        self.save_button.state(["!disabled"])
     
     def get_config(self) -> Dict[str, Any]:
         """Get the current configuration.
@@ -3,14 +3,33 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
-import json
+import orjson
 import logging
-from typing import Dict, Any, Optional
+import re
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple
 from PIL import Image, ImageTk
 import datetime
 
 logger = logging.getLogger(__name__)
 
+# Largest size screenshots are shown at, and how many resized ones to keep
+THUMBNAIL_SIZE = (400, 300)
+THUMB_CACHE_SIZE = 32
+
+# JSON tokens to highlight, one named group per text tag; strings are
+# matched before numbers so digits inside them are not highlighted.
+# Formatted JSON never splits a token across lines, so lines are
+# tokenized independently
+_JSON_TOKEN = re.compile(
+    r'(?P<key>"(?:[^"\\]|\\.)*")(?=\s*:)'
+    r'|(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)'
+    r'|(?P<keyword>\b(?:true|false|null)\b)'
+)
+_JSON_TAGS = tuple(_JSON_TOKEN.groupindex)
+
 class DataViewer(ttk.Frame):
     """Component for viewing detailed request/response data."""
     
@@ -25,6 +44,21 @@ class DataViewer(ttk.Frame):
         self.current_request: Optional[Dict[str, Any]] = None
         self.current_response: Optional[Dict[str, Any]] = None
         self.current_screenshot: Optional[Image.Image] = None
+        self._last_request_bytes: Optional[bytes] = None
+        self._last_response_bytes: Optional[bytes] = None
+        
+        # Screenshots are resized on a worker thread; the resulting photos
+        # are cached per image, oldest first, for repeat selections
+        self._resize_pool = ThreadPoolExecutor(max_workers=1)
+        self._thumb_future: Optional[Future] = None
+        self._thumb_cache: Dict[int, Tuple[weakref.ref, ImageTk.PhotoImage]] = {}
+        # Whether current_screenshot has yet to be shown
+        self._screenshot_dirty = False
+        
+        # Formatted JSON lines per text widget and the line numbers already
+        # highlighted; highlighting follows the visible part as it scrolls
+        self._json_lines: Dict[ScrolledText, List[str]] = {}
+        self._tagged_lines: Dict[ScrolledText, Set[int]] = {}
         
         self._init_ui()
     
@@ -77,6 +111,9 @@ class DataViewer(ttk.Frame):
         self.screenshot_label = ttk.Label(self.screenshot_frame, text="No screenshot available")
         self.screenshot_label.pack(fill="both", expand=True, padx=5, pady=5)
         
+        # Screenshots are only resized and converted once this tab is shown
+        self.notebook.bind("<<NotebookTabChanged>>", self._maybe_render_screenshot)
+        
         # Details tab
         self.details_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.details_frame, text="Details")
@@ -102,6 +139,14 @@ class DataViewer(ttk.Frame):
         
         # Configure text tags for syntax highlighting
         self._configure_text_tags()
+        
+        # Highlight newly exposed lines whenever the view scrolls or resizes
+        for text_widget in (self.request_text, self.response_text):
+            self._json_lines[text_widget] = []
+            self._tagged_lines[text_widget] = set()
+            text_widget.configure(
+                yscrollcommand=lambda first, last, w=text_widget: self._on_yscroll(w, first, last)
+            )
     
     def _configure_text_tags(self):
         """Configure syntax highlighting tags."""
@@ -121,83 +166,85 @@ class DataViewer(ttk.Frame):
         self.request_text.tag_configure("keyword", foreground="purple")
         self.response_text.tag_configure("keyword", foreground="purple")
     
-    def _highlight_json(self, text_widget: ScrolledText, json_str: str):
-        """Apply syntax highlighting to JSON text.
+    def _highlight_json(self, text_widget: ScrolledText, data: Any) -> bytes:
+        """Show data as syntax-highlighted JSON.
         
         Args:
             text_widget: Text widget to apply highlighting to
-            json_str: JSON string to highlight
+            data: Decoded JSON data, or a JSON string to parse first
+            
+        Returns:
+            The UTF-8 text shown in the widget
+        """
+        if isinstance(data, (str, bytes)):
+            try:
+                data = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # If not valid JSON, just insert plain text
+                text_widget.delete("1.0", tk.END)
+                self._json_lines[text_widget] = []
+                text_widget.insert("1.0", data)
+                return data.encode() if isinstance(data, str) else data
+        
+        encoded = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        self._highlight_formatted(text_widget, encoded.decode())
+        return encoded
+    
+    def _highlight_formatted(self, text_widget: ScrolledText, formatted: str):
+        """Show already formatted JSON text with syntax highlighting.
+        
+        Args:
+            text_widget: Text widget to apply highlighting to
+            formatted: Indented JSON text
         """
         text_widget.delete("1.0", tk.END)
+        text_widget.insert("1.0", formatted)
         
-        try:
-            # Format JSON
-            parsed = json.loads(json_str)
-            formatted = json.dumps(parsed, indent=2)
-            
-            # Insert formatted text
-            text_widget.insert("1.0", formatted)
-            
-            # Apply syntax highlighting
-            lines = formatted.split("\n")
-            line_num = 1
-            
-            for line in lines:
-                # Highlight keys
-                if ":" in line:
-                    key_end = line.find(":")
-                    text_widget.tag_add(
-                        "key",
-                        f"{line_num}.{line.find('"')}",
-                        f"{line_num}.{key_end}"
-                    )
-                
-                # Highlight string values
-                quote_positions = []
-                pos = 0
-                while True:
-                    pos = line.find('"', pos)
-                    if pos == -1:
-                        break
-                    quote_positions.append(pos)
-                    pos += 1
-                
-                for i in range(0, len(quote_positions), 2):
-                    if i + 1 < len(quote_positions):
-                        text_widget.tag_add(
-                            "string",
-                            f"{line_num}.{quote_positions[i]}",
-                            f"{line_num}.{quote_positions[i+1]+1}"
-                        )
-                
-                # Highlight numbers
-                for i, char in enumerate(line):
-                    if char.isdigit():
-                        text_widget.tag_add(
-                            "number",
-                            f"{line_num}.{i}",
-                            f"{line_num}.{i+1}"
-                        )
-                
-                # Highlight keywords
-                for keyword in ["true", "false", "null"]:
-                    pos = 0
-                    while True:
-                        pos = line.find(keyword, pos)
-                        if pos == -1:
-                            break
-                        text_widget.tag_add(
-                            "keyword",
-                            f"{line_num}.{pos}",
-                            f"{line_num}.{pos+len(keyword)}"
-                        )
-                        pos += len(keyword)
-                
-                line_num += 1
-                
-        except json.JSONDecodeError:
-            # If not valid JSON, just insert plain text
-            text_widget.insert("1.0", json_str)
+        # Highlight only what is on screen; the rest follows on scroll
+        self._json_lines[text_widget] = formatted.split("\n")
+        self._tagged_lines[text_widget] = set()
+        self._highlight_visible(text_widget)
+    
+    def _on_yscroll(self, text_widget: ScrolledText, first: str, last: str):
+        """Update the scrollbar and highlight any newly visible lines."""
+        text_widget.vbar.set(first, last)
+        self._highlight_visible(text_widget)
+    
+    def _highlight_visible(self, text_widget: ScrolledText):
+        """Highlight the lines currently shown in a text widget."""
+        if not self._json_lines[text_widget]:
+            return
+        start_line = int(text_widget.index("@0,0").split(".")[0])
+        end_line = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split(".")[0])
+        self._highlight_range(text_widget, start_line, end_line)
+    
+    def _highlight_range(self, text_widget: ScrolledText, start_line: int, end_line: int):
+        """Apply syntax highlighting to lines not yet tagged in a range.
+        
+        Args:
+            text_widget: Text widget to apply highlighting to
+            start_line: First line to highlight (1-based)
+            end_line: Last line to highlight, inclusive
+        """
+        lines = self._json_lines[text_widget]
+        tagged = self._tagged_lines[text_widget]
+        
+        # Collect every range first so each tag costs one tag_add call
+        spans: Dict[str, List[str]] = {tag: [] for tag in _JSON_TAGS}
+        for line_num in range(start_line, min(end_line, len(lines)) + 1):
+            if line_num in tagged:
+                continue
+            tagged.add(line_num)
+            for match in _JSON_TOKEN.finditer(lines[line_num - 1]):
+                start, end = match.span()
+                spans[match.lastgroup] += (f"{line_num}.{start}", f"{line_num}.{end}")
+        
+        for tag, indices in spans.items():
+            if indices:
+                text_widget.tag_add(tag, *indices)
     
     def update_request_data(self, data: Dict[str, Any]):
         """Update the display with new request/response data.
@@ -213,27 +260,15 @@ class DataViewer(ttk.Frame):
             
             # Update request/response text
             if self.current_request:
-                self._highlight_json(
-                    self.request_text,
-                    json.dumps(self.current_request)
-                )
+                self._last_request_bytes = self._highlight_json(self.request_text, self.current_request)
             
             if self.current_response:
-                self._highlight_json(
-                    self.response_text,
-                    json.dumps(self.current_response)
-                )
+                self._last_response_bytes = self._highlight_json(self.response_text, self.current_response)
             
-            # Update screenshot if available
+            # Update screenshot if available, once its tab is shown
             if self.current_screenshot and isinstance(self.current_screenshot, Image.Image):
-                # Resize image to fit display while maintaining aspect ratio
-                display_size = (400, 300)
-                self.current_screenshot.thumbnail(display_size, Image.Resampling.LANCZOS)
-                
-                # Convert to PhotoImage for display
-                photo = ImageTk.PhotoImage(self.current_screenshot)
-                self.screenshot_label.configure(image=photo, text="")
-                self.screenshot_label.image = photo
+                self._screenshot_dirty = True
+                self._maybe_render_screenshot()
             
             # Update details
             timestamp = data.get("timestamp")
@@ -242,21 +277,81 @@ class DataViewer(ttk.Frame):
                     datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
                 )
             
+            # Sizes come from the text already encoded for display
             if self.current_request:
-                self.request_size_var.set(f"{len(str(self.current_request))} bytes")
+                self.request_size_var.set(f"{len(self._last_request_bytes)} bytes")
             
             if self.current_response:
-                self.response_size_var.set(f"{len(str(self.current_response))} bytes")
+                self.response_size_var.set(f"{len(self._last_response_bytes)} bytes")
             
             logger.debug("Data viewer updated successfully")
             
         except Exception as e:
             logger.error(f"Error updating data viewer: {e}")
     
+    def _maybe_render_screenshot(self, event=None):
+        """Render a pending screenshot if the Screenshot tab is showing."""
+        if self._screenshot_dirty and self.notebook.select() == str(self.screenshot_frame):
+            self._screenshot_dirty = False
+            self._show_screenshot(self.current_screenshot)
+    
+    def _show_screenshot(self, image: Image.Image):
+        """Display a screenshot, resizing it in the background on first show.
+        
+        Args:
+            image: Screenshot to display
+        """
+        cached = self._thumb_cache.get(id(image))
+        if cached is not None and cached[0]() is image:
+            self._thumb_future = None
+            self._set_screenshot_photo(cached[1])
+            return
+        
+        self._thumb_future = self._resize_pool.submit(self._make_thumb, image)
+        self.after(10, self._poll_thumb, self._thumb_future, image)
+    
+    @staticmethod
+    def _make_thumb(image: Image.Image) -> Image.Image:
+        """Resize a copy of an image to fit the display, keeping its aspect ratio."""
+        thumb = image.copy()
+        thumb.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+        return thumb
+    
+    def _poll_thumb(self, future: Future, image: Image.Image):
+        """Show a background resize once it finishes, unless superseded."""
+        if future is not self._thumb_future:
+            return
+        if not future.done():
+            self.after(10, self._poll_thumb, future, image)
+            return
+        self._thumb_future = None
+        
+        try:
+            thumb = future.result()
+        except Exception as e:
+            logger.error(f"Error resizing screenshot: {e}")
+            return
+        
+        # PhotoImage must be created on the Tk thread
+        photo = ImageTk.PhotoImage(thumb)
+        if len(self._thumb_cache) >= THUMB_CACHE_SIZE:
+            del self._thumb_cache[next(iter(self._thumb_cache))]
+        # A weak reference to the image guards against a reused id()
+        # without keeping the full-size screenshot alive
+        self._thumb_cache[id(image)] = (weakref.ref(image), photo)
+        self._set_screenshot_photo(photo)
+    
+    def _set_screenshot_photo(self, photo: ImageTk.PhotoImage):
+        self.screenshot_label.configure(image=photo, text="")
+        self.screenshot_label.image = photo
+    
     def clear_data(self):
         """Clear all data and reset to initial state."""
-        self.request_text.delete("1.0", tk.END)
-        self.response_text.delete("1.0", tk.END)
+        for text_widget in (self.request_text, self.response_text):
+            text_widget.delete("1.0", tk.END)
+            self._json_lines[text_widget] = []
+        self._thumb_future = None
+        self._screenshot_dirty = False
         self.screenshot_label.configure(image="", text="No screenshot available")
         self.timestamp_var.set("N/A")
         self.request_size_var.set("N/A")
@@ -264,4 +359,6 @@ class DataViewer(ttk.Frame):
         
         self.current_request = None
         self.current_response = None
-        self.current_screenshot = None
\ No newline at end of file
+        self.current_screenshot = None
+        self._last_request_bytes = None
+        self._last_response_bytes = None
\ No newline at end of file
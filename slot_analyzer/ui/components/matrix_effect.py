@@ -1,9 +1,65 @@
 """Matrix-style animation effect for the UI."""
 
 import tkinter as tk
-import random
 import string
-from typing import List, Tuple, Optional
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+# How often to check whether a hidden animation has become visible again
+HIDDEN_POLL_MS = 500
+
+# Characters the falling code is drawn from; column state stores indices
+_CHARSET = np.array(list(string.ascii_letters + string.digits))
+
+def _load_font() -> ImageFont.ImageFont:
+    """Load a 10pt Courier font, falling back to Pillow's built-in font."""
+    try:
+        return ImageFont.truetype("cour.ttf", 10)
+    except OSError:
+        return ImageFont.load_default()
+
+# Numba compiles the per-frame state update into a single native loop over
+# the columns; it is optional, and without it the update runs as NumPy
+# array operations
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _tick_state_py(ys, lengths, chars, height, num_chars):
+    """Advance every column by one frame in place.
+    
+    Changes some of the characters drawn last frame, moves all characters
+    down, drops those that have fallen off the bottom from the front of
+    each column and randomly adds a new character at the top.
+    """
+    num_cols, capacity = ys.shape
+    for c in range(num_cols):
+        n = lengths[c]
+        for j in range(n):
+            if np.random.random() < 0.05:
+                chars[c, j] = np.random.randint(0, num_chars)
+            ys[c, j] += 5
+        
+        fallen = 0
+        while fallen < n and ys[c, fallen] > height:
+            fallen += 1
+        if fallen:
+            n -= fallen
+            for j in range(n):
+                ys[c, j] = ys[c, j + fallen]
+                chars[c, j] = chars[c, j + fallen]
+        
+        if (n == 0 or ys[c, n - 1] > 20) and n < capacity and np.random.random() < 0.1:
+            ys[c, n] = 0
+            chars[c, n] = np.random.randint(0, num_chars)
+            n += 1
+        lengths[c] = n
+
+_tick_state = njit(cache=True)(_tick_state_py) if njit is not None else None
 
 class MatrixEffect:
     """Matrix-style falling code animation effect."""
@@ -28,8 +84,30 @@ class MatrixEffect:
         self.density = density
         self.speed = speed
         self.running = False
-        self.columns: List[Tuple[int, List[int], List[str]]] = []
         self.timer_id: Optional[str] = None
+        # Monotonic time the current frame was due
+        self._next_tick = time.monotonic()
+        
+        # Faded colors by position in a column; fading reaches black at
+        # position 11, so the last entry covers everything after it
+        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+        self._palette = [
+            f"#{min(255, int(r * fade / 255)):02x}"
+            f"{min(255, int(g * fade / 255)):02x}"
+            f"{min(255, int(b * fade / 255)):02x}"
+            for fade in (max(0, 255 - (j * 25)) for j in range(12))
+        ]
+        
+        # Frames are drawn into one image shown by a single canvas item
+        self._pil_font = _load_font()
+        left, top, right, bottom = self._pil_font.getbbox("M")
+        # Offset that centres a character on its position, as canvas text does
+        self._text_offset = ((left + right) // 2, (top + bottom) // 2)
+        self._photo: Optional[ImageTk.PhotoImage] = None
+        self._photo_size: Optional[Tuple[int, int]] = None
+        self._canvas_img_id: Optional[int] = None
+        
+        self._rng = np.random.default_rng()
         
         # Bind resize event
         self.canvas.bind("<Configure>", self._on_resize)
@@ -39,37 +117,80 @@ class MatrixEffect:
     
     def _init_columns(self):
         """Initialize the columns of falling characters."""
-        self.columns = []
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         
         if width <= 1 or height <= 1:
             # Canvas not ready yet
-            return
+            width = height = 0
         
         # Calculate number of columns based on width
         col_width = 10
         num_cols = width // col_width
         
-        # Create columns
-        for i in range(num_cols):
-            x = i * col_width
-            # Each column has: x-position, y-positions, characters
-            y_positions = []
-            chars = []
-            
-            # Only create initial characters for some columns
-            if random.random() < self.density:
-                # Random starting position
-                y = random.randint(-height // 2, height // 2)
-                # Random length of the column
-                length = random.randint(5, 15)
-                
-                for j in range(length):
-                    y_positions.append(y + j * 15)
-                    chars.append(random.choice(string.ascii_letters + string.digits))
-            
-            self.columns.append((x, y_positions, chars))
+        # Room for the longest initial column plus one new character per
+        # 25px of fall (new ones need a 20px gap) over 1.5 screen heights
+        capacity = 17 + (3 * height) // 50 if num_cols else 0
+        
+        # Column state as arrays: x-positions, then y-positions and
+        # characters per column, of which the first _len entries are live
+        self._col_x = np.arange(num_cols, dtype=np.int32) * col_width
+        self._ys = np.zeros((num_cols, capacity), dtype=np.int32)
+        self._chars = np.zeros((num_cols, capacity), dtype=np.uint8)
+        self._len = np.zeros(num_cols, dtype=np.int32)
+        if not num_cols:
+            return
+        
+        # Only create initial characters for some columns, each with a
+        # random starting position and length
+        active = np.flatnonzero(self._rng.random(num_cols) < self.density)
+        starts = self._rng.integers(-height // 2, height // 2, size=active.size, endpoint=True)
+        lengths = self._rng.integers(5, 15, size=active.size, endpoint=True)
+        self._ys[active] = starts[:, None] + np.arange(capacity, dtype=np.int32) * 15
+        self._chars[active] = self._random_chars((active.size, capacity))
+        self._len[active] = lengths
+    
+    def _random_chars(self, size) -> np.ndarray:
+        """Draw random characters for the falling code, as _CHARSET indices."""
+        return self._rng.integers(0, len(_CHARSET), size=size, dtype=np.uint8)
+    
+    def _advance(self, height: int):
+        """Advance the column state by one frame."""
+        if _tick_state is not None:
+            _tick_state(self._ys, self._len, self._chars, height, len(_CHARSET))
+            return
+        
+        ys, chars, lengths = self._ys, self._chars, self._len
+        num_cols, capacity = ys.shape
+        offsets = np.arange(capacity)
+        
+        # Randomly change some of the characters drawn last frame
+        changed = (self._rng.random(ys.shape) < 0.05) & (offsets < lengths[:, None])
+        chars[changed] = self._random_chars(int(changed.sum()))
+        
+        # Move characters down
+        ys += 5
+        
+        # Remove characters that have fallen off the bottom from the front
+        # of each column, shifting the rest forward
+        live = offsets < lengths[:, None]
+        fallen = np.cumprod((ys > height) & live, axis=1).sum(axis=1)
+        if fallen.any():
+            shifted = np.minimum(offsets + fallen[:, None], capacity - 1)
+            ys[:] = np.take_along_axis(ys, shifted, axis=1)
+            chars[:] = np.take_along_axis(chars, shifted, axis=1)
+            lengths -= fallen.astype(np.int32)
+        
+        # Randomly add new characters at the top
+        last = ys[np.arange(num_cols), np.maximum(lengths - 1, 0)]
+        grow = np.flatnonzero(
+            ((lengths == 0) | (last > 20))
+            & (lengths < capacity)
+            & (self._rng.random(num_cols) < 0.1)
+        )
+        ys[grow, lengths[grow]] = 0
+        chars[grow, lengths[grow]] = self._random_chars(grow.size)
+        lengths[grow] += 1
     
     def _on_resize(self, event):
         """Handle canvas resize event."""
@@ -79,6 +200,7 @@ class MatrixEffect:
         """Start the animation."""
         if not self.running:
             self.running = True
+            self._next_tick = time.monotonic()
             self._animate()
     
     def stop(self):
@@ -96,61 +218,63 @@ class MatrixEffect:
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         
-        # Clear canvas
-        self.canvas.delete("matrix")
-        
-        # Update and draw each column
-        for i, (x, y_positions, chars) in enumerate(self.columns):
-            # Move characters down
-            y_positions = [y + 5 for y in y_positions]
-            
-            # Remove characters that have fallen off the bottom
-            while y_positions and y_positions[0] > height:
-                y_positions.pop(0)
-                chars.pop(0)
-            
-            # Randomly add new characters at the top
-            if (not y_positions or y_positions[-1] > 20) and random.random() < 0.1:
-                y_positions.append(0)
-                chars.append(random.choice(string.ascii_letters + string.digits))
-            
-            # Draw characters
-            for j, (y, char) in enumerate(zip(y_positions, chars)):
+        # Nothing can be seen while unmapped or not laid out yet, so only
+        # check back now and then
+        if width <= 1 or height <= 1 or not self.canvas.winfo_viewable():
+            self._next_tick = time.monotonic()
+            self.timer_id = self.canvas.after(HIDDEN_POLL_MS, self._animate)
+            return
+        
+        self._advance(height)
+        
+        palette = self._palette
+        last_shade = len(palette) - 1
+        ys, chars, lengths = self._ys, self._chars, self._len
+        
+        # Render the whole frame in PIL and show it as a single canvas image
+        frame = Image.new("RGB", (max(width, 1), max(height, 1)), "black")
+        draw = ImageDraw.Draw(frame)
+        font = self._pil_font
+        dx, dy = self._text_offset
+        
+        # Draw characters
+        for i in np.flatnonzero(lengths).tolist():
+            x = int(self._col_x[i]) - dx
+            n = int(lengths[i])
+            for j, (y, char) in enumerate(zip(ys[i, :n].tolist(), _CHARSET[chars[i, :n]].tolist())):
                 # Vary color intensity based on position
-                alpha = 255
-                if j == len(y_positions) - 1:
+                if j == n - 1:
                     # Head of the column is brightest
                     color = self.color
                 else:
                     # Fade out older characters
-                    fade = max(0, 255 - (j * 25))
-                    r, g, b = int(self.color[1:3], 16), int(self.color[3:5], 16), int(self.color[5:7], 16)
-                    r = min(255, int(r * fade / 255))
-                    g = min(255, int(g * fade / 255))
-                    b = min(255, int(b * fade / 255))
-                    color = f"#{r:02x}{g:02x}{b:02x}"
+                    color = palette[min(j, last_shade)]
                 
                 # Draw the character
-                self.canvas.create_text(
-                    x, y, 
-                    text=char, 
-                    fill=color, 
-                    font=("Courier", 10), 
-                    tags="matrix"
+                draw.text((x, y - dy), char, fill=color, font=font)
+        
+        if self._photo is not None and self._photo_size == frame.size:
+            self._photo.paste(frame)
+        else:
+            self._photo = ImageTk.PhotoImage(frame)
+            self._photo_size = frame.size
+            if self._canvas_img_id is None:
+                self._canvas_img_id = self.canvas.create_image(
+                    0, 0, anchor="nw", image=self._photo, tags="matrix"
                 )
-            
-            # Update the column
-            self.columns[i] = (x, y_positions, chars)
-        
-        # Randomly change some characters
-        for i, (x, y_positions, chars) in enumerate(self.columns):
-            for j in range(len(chars)):
-                if random.random() < 0.05:
-                    chars[j] = random.choice(string.ascii_letters + string.digits)
-            self.columns[i] = (x, y_positions, chars)
-        
-        # Schedule next frame
-        self.timer_id = self.canvas.after(self.speed, self._animate)
+            else:
+                self.canvas.itemconfigure(self._canvas_img_id, image=self._photo)
+        
+        # Schedule next frame against a fixed cadence, so time spent
+        # drawing does not stretch the interval; after falling more than
+        # a frame behind, restart the cadence rather than catching up
+        interval = self.speed / 1000
+        now = time.monotonic()
+        self._next_tick += interval
+        if self._next_tick < now - interval:
+            self._next_tick = now
+        delay_ms = max(1, int((self._next_tick - now) * 1000))
+        self.timer_id = self.canvas.after(delay_ms, self._animate)
 
 class MatrixBackground(tk.Frame):
     """A frame with a matrix animation background."""
@@ -3,7 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
-import json
+import orjson
 import logging
 from typing import Optional, Dict, Any, List
 from slot_analyzer.services.pattern import PatternAnalyzer
@@ -24,6 +24,10 @@ class PatternViewer(ttk.Frame):
         
         self.pattern_analyzer = pattern_analyzer
         self.current_patterns: List[Dict[str, Any]] = []
+        # Tree item id -> pattern shown in that row
+        self._pattern_by_item: Dict[str, Dict[str, Any]] = {}
+        # Tree item id -> formatted details, filled on first selection
+        self._details_cache: Dict[str, str] = {}
         
         self._init_ui()
     
@@ -121,21 +125,25 @@ class PatternViewer(ttk.Frame):
                 logger.warning("Invalid pattern data received")
                 return
             
-            # Clear existing items
-            for item in self.pattern_tree.get_children():
-                self.pattern_tree.delete(item)
-            
-            # Add new patterns
-            for pattern in patterns:
-                self.pattern_tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        pattern.get("type", "Unknown"),
-                        f"{pattern.get('confidence', 0):.1f}%",
-                        pattern.get("last_seen", "N/A")
-                    )
+            rows = [
+                (
+                    pattern.get("type", "Unknown"),
+                    f"{pattern.get('confidence', 0):.1f}%",
+                    pattern.get("last_seen", "N/A")
                 )
+                for pattern in patterns
+            ]
+            
+            # Clear existing items in one call
+            self.pattern_tree.delete(*self.pattern_tree.get_children())
+            
+            # Add new patterns, remembering which pattern each row shows
+            insert = self.pattern_tree.insert
+            self._pattern_by_item = {
+                insert("", "end", values=values): pattern
+                for values, pattern in zip(rows, patterns)
+            }
+            self._details_cache = {}
             
             # Update statistics
             self.total_patterns.set(str(data.get("total_patterns", 0)))
@@ -158,24 +166,25 @@ class PatternViewer(ttk.Frame):
             
         # Get selected pattern details
         item = selection[0]
-        pattern_type = self.pattern_tree.item(item)["values"][0]
-        
-        # Find pattern details
-        pattern = next(
-            (p for p in self.current_patterns if p["type"] == pattern_type),
-            None
-        )
+        pattern = self._pattern_by_item.get(item)
         
         if pattern:
-            # Format pattern details
-            details = json.dumps(pattern, indent=2)
+            # Format pattern details, once per row
+            details = self._details_cache.get(item)
+            if details is None:
+                details = orjson.dumps(
+                    pattern,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+                self._details_cache[item] = details
             self.details_text.delete("1.0", tk.END)
             self.details_text.insert("1.0", details)
     
     def clear_patterns(self):
         """Clear all patterns and reset to initial state."""
-        for item in self.pattern_tree.get_children():
-            self.pattern_tree.delete(item)
+        self.pattern_tree.delete(*self.pattern_tree.get_children())
+        self._pattern_by_item = {}
+        self._details_cache = {}
         self.details_text.delete("1.0", tk.END)
         self.total_patterns.set("0")
         self.active_patterns.set("0")
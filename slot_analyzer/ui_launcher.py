@@ -5,6 +5,8 @@ import logging
 import sys
 from pathlib import Path
 
+from slot_analyzer.log_utils import configure_logging
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +17,7 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Launch the slot analyzer UI application."""
+    configure_logging()
     try:
         # Create the root window
         root = tk.Tk()
@@ -1,5 +1,7 @@
 """Test script for configuration validation."""
-from slot_analyzer.config import Settings
+from dataclasses import fields
+
+from slot_analyzer.config import FastSettings, Settings
 
 def test_settings():
     """Test configuration settings loading."""
@@ -15,5 +17,40 @@ def test_settings():
     print(f"CAPTURE_THROTTLE_MS: {settings.CAPTURE_THROTTLE_MS}")
     print(f"MAX_CAPTURE_QUEUE: {settings.MAX_CAPTURE_QUEUE}")
 
+def test_fast_settings_agree():
+    """Test that Settings and FastSettings read the same environment."""
+    import os
+    overrides = {
+        "SLOT_ANALYZER_ENV": "staging",
+        "SLOT_ANALYZER_DEBUG": "true",
+        "REDIS_HOST": "redis.internal",
+        "REDIS_PORT": "6380",
+        "REDIS_DB": "2",
+        "PROXY_HOST": "0.0.0.0",
+        "SLOT_ANALYZER_CAPTURE_PROXY_PORT": "9090",
+        "SLOT_ANALYZER_CAPTURE_SCREENSHOT_THROTTLE_MS": "250",
+        "SLOT_ANALYZER_CAPTURE_MAX_CAPTURE_QUEUE": "50",
+        "LOG_LEVEL": "DEBUG",
+        "LOG_FILE": "analyzer.log",
+    }
+    saved = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        settings = Settings()
+        fast = FastSettings()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    
+    for f in fields(FastSettings):
+        assert getattr(settings, f.name) == getattr(fast, f.name), f.name
+    assert settings.ENV == "staging"
+    assert settings.PROXY_PORT == 9090
+    print("Settings and FastSettings agree")
+
 if __name__ == "__main__":
-    test_settings()
\ No newline at end of file
+    test_settings()
+    test_fast_settings_agree()
\ No newline at end of file
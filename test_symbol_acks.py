@@ -0,0 +1,53 @@
+"""Test script for batched acknowledgement in the symbol recognition service."""
+from concurrent.futures import Future
+from queue import SimpleQueue
+
+from slot_analyzer.services.symbol import SymbolRecognitionService
+
+class FakeMessage:
+    """Message that records acks the way an AMQP channel applies them."""
+    
+    def __init__(self, delivery_tag, acked):
+        self.delivery_tag = delivery_tag
+        self.acked = acked
+    
+    def ack(self, multiple=False):
+        if multiple:
+            self.acked.update(range(1, self.delivery_tag + 1))
+        else:
+            self.acked.add(self.delivery_tag)
+    
+    def reject(self):
+        raise AssertionError(f"message {self.delivery_tag} rejected")
+
+def test_out_of_order_completion_acks_every_tag():
+    """Test that cumulative acks cover messages finished out of order."""
+    service = SymbolRecognitionService.__new__(SymbolRecognitionService)
+    service._completed = SimpleQueue()
+    service._in_flight = 0
+    service._pending_acks = []
+    service._last_ack_flush = 0.0
+    service._multiple_acks = True
+    service._store_results = lambda symbols, timestamp: None
+    
+    acked = set()
+    messages = [FakeMessage(tag, acked) for tag in range(1, 6)]
+    futures = [Future() for _ in messages]
+    for message, future in zip(messages, futures):
+        service._in_flight += 1
+        future.add_done_callback(
+            lambda done, message=message: service._completed.put((message, "0", done))
+        )
+    
+    # Finish the highest tags first, so the last one settled has a low tag
+    for future in reversed(futures):
+        future.set_result([])
+    service._settle_completed()
+    service._flush_acks()
+    
+    assert acked == {1, 2, 3, 4, 5}
+    assert not service._pending_acks
+
+if __name__ == "__main__":
+    test_out_of_order_completion_acks_every_tag()
+    print("Out-of-order acks OK")
@@ -0,0 +1,62 @@
+"""Test script for batched symbol matching at the screenshot edge."""
+import os
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from slot_analyzer.config import get_settings
+from slot_analyzer.config.layouts import GameLayout, GridPosition, SymbolTemplate
+from slot_analyzer.services.symbol.recognizer import SymbolRecognizer
+
+CELL = 20
+
+def _row_pattern(seed):
+    """A cell whose rows vary but whose columns repeat, so clipping its
+    width leaves the same image as squeezing the whole template."""
+    rows = np.random.default_rng(seed).integers(0, 256, size=(CELL, 1), dtype=np.uint8)
+    return np.repeat(rows, CELL, axis=1)
+
+def test_cell_crossing_frame_edge_is_matched():
+    """Test that a cell clipped by the frame edge is still recognized."""
+    templates = {"cherry": _row_pattern(1), "bell": _row_pattern(2)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name, template in templates.items():
+            cv2.imwrite(str(tmp / f"{name}.png"), template)
+
+        # The third cell starts 10 pixels before the right edge of the frame
+        positions = [
+            GridPosition(row=0, col=col, x=col * CELL, y=0, width=CELL, height=CELL)
+            for col in range(3)
+        ]
+        layout = GameLayout(
+            name="edge",
+            grid_size=(1, 3),
+            positions=positions,
+            symbols=[SymbolTemplate(name, Path(f"{name}.png")) for name in templates],
+            template_dir=tmp
+        )
+        frame = np.hstack([templates["cherry"], templates["bell"], templates["bell"][:, :CELL // 2]])
+        cv2.imwrite(str(tmp / "frame.png"), frame)
+
+        # Keep the template cache out of the working tree
+        os.environ["BASE_DIR"] = str(tmp)
+        get_settings.cache_clear()
+        try:
+            recognizer = SymbolRecognizer(layout)
+            results = recognizer.extract_symbols(tmp / "frame.png")
+        finally:
+            del os.environ["BASE_DIR"]
+            get_settings.cache_clear()
+
+    assert [(name, position.col) for name, position, _ in results] == [
+        ("cherry", 0), ("bell", 1), ("bell", 2)
+    ]
+    assert all(confidence > 0.99 for _, _, confidence in results)
+
+if __name__ == "__main__":
+    test_cell_crossing_frame_edge_is_matched()
+    print("Edge cell matching OK")